@@ -9,7 +9,7 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from src.data_ingestion.noaa_api import fetch_noaa_alerts
+from src.data_ingestion.noaa_api import fetch_noaa_alerts, fetcher
 from src.alerts.alert_processor import AlertProcessor
 from src.translation.translator import translator
 
@@ -18,6 +18,10 @@ def fetch_nasa_data():
     """Fetch NASA/NOAA space weather data"""
     print("Fetching space weather data from NOAA...")
     alerts = fetch_noaa_alerts()
+    if fetcher.is_stale:
+        age_minutes = int(fetcher.data_age.total_seconds() // 60)
+        print(f"⚠️ NOAA unavailable ({fetcher.last_error}; circuit {fetcher.breaker.state.value}), "
+              f"using last-known-good data from {age_minutes} min ago")
     print(f"Fetched {len(alerts)} alerts")
     return alerts
 
@@ -87,7 +91,11 @@ def main():
     alerts = fetch_nasa_data()
     
     if not alerts:
-        print("No alerts received. System may be offline or no active alerts.")
+        if fetcher.last_error:
+            print(f"NOAA unavailable and no saved data: {fetcher.last_error} "
+                  f"(circuit {fetcher.breaker.state.value})")
+        else:
+            print("No alerts received. No active alerts.")
         return
     
     # Process for health-sensitive people
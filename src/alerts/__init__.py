@@ -5,6 +5,9 @@ Designed for cardiovascular patients, elderly, and other weather-sensitive indiv
 
 from .alert_models import Alert, GeomagneticAlert, ForecastAlert
 from .alert_processor import AlertProcessor
+from .alert_index import ActiveAlertIndex
+from .message_store import MessageStore
 
-__all__ = ['Alert', 'GeomagneticAlert', 'ForecastAlert', 'AlertProcessor']
+__all__ = ['Alert', 'GeomagneticAlert', 'ForecastAlert', 'AlertProcessor', 'ActiveAlertIndex',
+           'MessageStore']
 
@@ -0,0 +1,122 @@
+"""
+Interval index of active geomagnetic alerts
+Answers "what is active at time t" and "what was active during [a, b]"
+"""
+
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+from .alert_models import Alert, GeomagneticAlert, utc_now
+
+
+# Open-ended alerts (no Valid To) are treated as valid until cancelled
+OPEN_END = datetime.max
+
+
+class ActiveAlertIndex:
+    """
+    Static interval index over alert validity windows
+
+    Extension bulletins are merged into the chain of the alert they extend
+    and cancellation bulletins truncate it, so every chain becomes a single
+    interval represented by its most recent bulletin. Intervals are kept in
+    an implicit balanced search tree (sorted by start, augmented with the
+    maximum end of each subtree), giving O(log n + k) queries.
+    """
+
+    def __init__(self, alerts: Iterable[Alert]):
+        intervals = self._resolve_chains(alerts)
+        intervals.sort(key=lambda item: item[0])
+
+        self._starts = [start for start, _, _ in intervals]
+        self._ends = [end for _, end, _ in intervals]
+        self._alerts = [alert for _, _, alert in intervals]
+        self._max_end: List[datetime] = [datetime.min] * len(intervals)
+        self._build(0, len(intervals))
+
+    def __len__(self) -> int:
+        return len(self._alerts)
+
+    @staticmethod
+    def _resolve_chains(alerts: Iterable[Alert]) -> List[Tuple[datetime, datetime, GeomagneticAlert]]:
+        """Follow extension/cancellation serial numbers and build one interval per chain"""
+        geomagnetic = sorted(
+            (alert for alert in alerts if isinstance(alert, GeomagneticAlert)),
+            key=lambda alert: alert.issue_time
+        )
+
+        root_of: Dict[str, str] = {}
+        chains: Dict[str, List[GeomagneticAlert]] = {}
+        cancelled: Dict[str, datetime] = {}
+
+        for alert in geomagnetic:
+            if alert.cancels_serial:
+                root = root_of.get(alert.cancels_serial)
+                if root is not None:
+                    cancelled[root] = alert.issue_time
+                continue
+
+            # An extension whose original is not in the feed starts its own chain
+            root = root_of.get(alert.extends_serial or '', alert.serial_number)
+            root_of[alert.serial_number] = root
+            chains.setdefault(root, []).append(alert)
+
+        intervals = []
+        for root, chain in chains.items():
+            start = min(alert.starts_at for alert in chain)
+            if any(alert.valid_to is None for alert in chain):
+                end = OPEN_END
+            else:
+                end = max(alert.valid_to for alert in chain)
+
+            cancelled_at = cancelled.get(root)
+            if cancelled_at is not None:
+                end = min(end, cancelled_at)
+
+            # Keep is_active() on every chain member in line with the index
+            for alert in chain:
+                alert.cancelled_at = cancelled_at
+                alert.chain_start = start
+                alert.chain_end = end
+
+            if end >= start:
+                intervals.append((start, end, chain[-1]))
+
+        return intervals
+
+    def _build(self, lo: int, hi: int) -> datetime:
+        """Fill subtree maximum ends; the node for [lo, hi) is its midpoint"""
+        if lo >= hi:
+            return datetime.min
+        mid = (lo + hi) // 2
+        max_end = max(self._ends[mid], self._build(lo, mid), self._build(mid + 1, hi))
+        self._max_end[mid] = max_end
+        return max_end
+
+    def active_during(self, start: datetime, end: datetime) -> List[GeomagneticAlert]:
+        """Alerts whose validity overlaps [start, end]"""
+        found = []
+        stack = [(0, len(self._alerts))]
+
+        while stack:
+            lo, hi = stack.pop()
+            if lo >= hi:
+                continue
+            mid = (lo + hi) // 2
+            # Nothing in this subtree ends late enough
+            if self._max_end[mid] < start:
+                continue
+
+            stack.append((lo, mid))
+            # Right subtree (and this node) only start later
+            if self._starts[mid] <= end:
+                if self._ends[mid] >= start:
+                    found.append(mid)
+                stack.append((mid + 1, hi))
+
+        found.sort()
+        return [self._alerts[i] for i in found]
+
+    def active_at(self, at: Optional[datetime] = None) -> List[GeomagneticAlert]:
+        """Alerts active at the given UTC time (default: now)"""
+        at = at or utc_now()
+        return self.active_during(at, at)
@@ -3,11 +3,16 @@ Alert models for weather-sensitive people
 Based on NASA/NOAA space weather data
 """
 
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from typing import Optional, Dict, Any
 from enum import Enum
 
 
+def utc_now() -> datetime:
+    """Current UTC time as a naive datetime, like parsed SWPC timestamps"""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
 class AlertSeverity(Enum):
     """Alert severity levels for weather-sensitive people"""
     NONE = 0
@@ -34,6 +39,30 @@ class Alert:
         self.full_message = full_message
         self.created_at = datetime.now()
         self.is_processed = False
+        # Set when the alert comes from a last-known-good snapshot
+        self.is_stale = False
+        self.data_age: Optional[timedelta] = None
+    
+    @property
+    def full_message(self) -> str:
+        """Message body (rebuilt from the message store if one is used)"""
+        if self._message_store is not None:
+            return self._message_store.get(self._message_id)
+        return self._full_message
+    
+    @full_message.setter
+    def full_message(self, value: str):
+        self._full_message = value
+        self._message_store = None
+        self._message_id = None
+    
+    def store_message(self, store) -> int:
+        """Move the message body into a MessageStore, keeping only its id"""
+        if self._message_store is not store:
+            self._message_id = store.add(self.full_message)
+            self._message_store = store
+            self._full_message = None
+        return self._message_id
     
     def get_severity(self) -> AlertSeverity:
         """Determine severity level from NOAA scale"""
@@ -80,15 +109,26 @@ class Alert:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert alert to dictionary"""
+        # Geomagnetic fields are None for other alert types
+        valid_from = getattr(self, 'valid_from', None)
+        valid_to = getattr(self, 'valid_to', None)
+        begin_time = getattr(self, 'begin_time', None)
         return {
             'message_code': self.message_code,
             'serial_number': self.serial_number,
             'issue_time': self.issue_time.isoformat(),
             'warning_type': self.warning_type,
+            'noaa_scale': getattr(self, 'noaa_scale', None),
+            'warning_condition': getattr(self, 'warning_condition', None),
+            'valid_from': valid_from.isoformat() if valid_from else None,
+            'valid_to': valid_to.isoformat() if valid_to else None,
+            'begin_time': begin_time.isoformat() if begin_time else None,
             'full_message': self.full_message,
             'severity': self.get_severity().name,
             'is_dangerous': self.is_dangerous_for_health(),
-            'health_impact': self.get_health_impact()
+            'health_impact': self.get_health_impact(),
+            'is_stale': self.is_stale,
+            'data_age_seconds': self.data_age.total_seconds() if self.data_age else None
         }
 
 
@@ -106,7 +146,9 @@ class GeomagneticAlert(Alert):
                  begin_time: Optional[datetime] = None,
                  warning_condition: Optional[str] = None,
                  noaa_scale: Optional[str] = None,
-                 potential_impacts: Optional[str] = None):
+                 potential_impacts: Optional[str] = None,
+                 extends_serial: Optional[str] = None,
+                 cancels_serial: Optional[str] = None):
         super().__init__(message_code, serial_number, issue_time, warning_type, full_message)
         self.valid_from = valid_from
         self.valid_to = valid_to
@@ -114,10 +156,32 @@ class GeomagneticAlert(Alert):
         self.warning_condition = warning_condition
         self.noaa_scale = noaa_scale
         self.potential_impacts = potential_impacts
+        # Extension/cancellation bulletins refer to an earlier serial number
+        self.extends_serial = extends_serial
+        self.cancels_serial = cancels_serial
+        # Set by ActiveAlertIndex: cancellation time and the effective window
+        # of the whole extension chain this alert belongs to
+        self.cancelled_at: Optional[datetime] = None
+        self.chain_start: Optional[datetime] = None
+        self.chain_end: Optional[datetime] = None
+    
+    @property
+    def starts_at(self) -> datetime:
+        """Start of the validity window"""
+        return self.valid_from or self.begin_time or self.issue_time
     
-    def is_active(self) -> bool:
-        """Check if alert is currently active"""
-        now = datetime.now()
+    def is_active(self, at: Optional[datetime] = None) -> bool:
+        """Check if alert is active at the given UTC time (default: now)"""
+        now = at or utc_now()  # SWPC times are UTC
+        if self.cancels_serial:
+            return False
+        if self.chain_end is not None:
+            # Resolved by ActiveAlertIndex (extensions and cancellation applied)
+            return self.chain_start <= now <= self.chain_end
+        if now < self.starts_at:
+            return False
+        if self.cancelled_at and now >= self.cancelled_at:
+            return False
         if self.valid_to:
             return now <= self.valid_to
         return True
@@ -3,14 +3,19 @@ Alert processor for weather-sensitive people
 Filters and processes alerts for cardiovascular patients, elderly, etc.
 """
 
-from typing import List, Dict
+from datetime import datetime
+from typing import List, Dict, Optional
 from .alert_models import Alert, AlertSeverity
+from .alert_index import ActiveAlertIndex
 try:
-    from ..translation.translator import translate_alert_data
+    from ..translation.translator import translate_alert_data, translate_alerts_multi
 except ImportError:
     # Fallback if translation module not available
     def translate_alert_data(data):
         return data
+    
+    def translate_alerts_multi(alerts, target_langs):
+        return {lang: [data.copy() for data in alerts] for lang in target_langs}
 
 
 class AlertProcessor:
@@ -18,11 +23,37 @@ class AlertProcessor:
     
     def __init__(self):
         self.health_threshold = AlertSeverity.STRONG  # G3 and above
+        # Active-alert index for the last alert set seen, keyed by the
+        # identities of its alerts
+        self._index_key: Optional[tuple] = None
+        self._index: Optional[ActiveAlertIndex] = None
     
     def filter_health_relevant(self, alerts: List[Alert]) -> List[Alert]:
         """Filter alerts that are relevant for health-sensitive people"""
         return [alert for alert in alerts if alert.is_dangerous_for_health()]
     
+    def get_active_index(self, alerts: List[Alert]) -> ActiveAlertIndex:
+        """
+        Get the active-alert index for an alert list
+        
+        The index is built once per fetched alert set and reused while the
+        same alert objects are passed in; adding, removing or replacing an
+        alert rebuilds it.
+        """
+        key = tuple(map(id, alerts))
+        if self._index is None or self._index_key != key:
+            self._index = ActiveAlertIndex(alerts)
+            self._index_key = key
+        return self._index
+    
+    def get_active_alerts(self, alerts: List[Alert], at: Optional[datetime] = None) -> List[Alert]:
+        """Get alerts active at the given UTC time, following extensions and cancellations"""
+        return self.get_active_index(alerts).active_at(at)
+    
+    def get_alerts_active_during(self, alerts: List[Alert], start: datetime, end: datetime) -> List[Alert]:
+        """Get alerts active at any point in [start, end]"""
+        return self.get_active_index(alerts).active_during(start, end)
+    
     def process_alerts(self, alerts: List[Alert], translate: bool = True) -> List[Dict]:
         """Process alerts and return formatted data"""
         processed = []
@@ -42,6 +73,20 @@ class AlertProcessor:
         
         return processed
     
+    def process_alerts_multi(self, alerts: List[Alert], languages: List[str],
+                             translate: bool = True) -> Dict[str, List[Dict]]:
+        """
+        Process alerts once and return {language: [alert dicts]}
+        
+        Alerts are formatted and their terms protected once, then translated
+        into every language in parallel. With translate=False every language
+        gets the untranslated alert dicts.
+        """
+        processed = self.process_alerts(alerts, translate=False)
+        if not translate:
+            return {lang: [alert_dict.copy() for alert_dict in processed] for lang in languages}
+        return translate_alerts_multi(processed, languages)
+    
     def get_critical_alerts(self, alerts: List[Alert]) -> List[Alert]:
         """Get only critical alerts (G4, G5)"""
         return [
@@ -0,0 +1,297 @@
+"""
+Deduplicated, compressed storage of alert message bodies
+SWPC bulletins repeat most of their lines, so bodies are split into
+lines, each distinct line is stored once (deflate-compressed with a
+shared dictionary) and a body is kept as a list of line ids
+"""
+
+import hashlib
+import struct
+import sys
+import threading
+import zlib
+from array import array
+from collections import Counter
+from pathlib import Path
+from typing import Iterable, Optional
+
+
+# Boilerplate from SWPC products, used as the preset deflate dictionary.
+# zlib favours the end of the dictionary, so the most common text goes last.
+DEFAULT_DICTIONARY = (
+    "Induced Currents - Power grid fluctuations can occur. High-latitude power systems may "
+    "experience voltage alarms.\r\n"
+    "Spacecraft - Satellite orientation irregularities may occur; increased drag on low Earth-orbit "
+    "satellites is possible.\r\n"
+    "Radio - HF (high frequency) radio propagation can fade at higher latitudes.\r\n"
+    "Aurora - Aurora may be visible at high latitudes such as Canada and Alaska.\r\n"
+    "Potential Impacts: Area of impact primarily poleward of 55 degrees Geomagnetic Latitude.\r\n"
+    "Potential Impacts: Area of impact primarily poleward of 60 degrees Geomagnetic Latitude.\r\n"
+    "Comment: A CME passage is expected. Solar wind speed and IMF Bz remain enhanced.\r\n"
+    "SUMMARY: X-ray Event exceeded M5\r\nX-ray Class: \r\nOptical Class: \r\nLocation: \r\n"
+    "ALERT: Type II Radio Emission\r\nEstimated Velocity:  km/s\r\n"
+    "Description: Type II emissions occur in association with eruptions on the sun and typically "
+    "indicate a coronal mass ejection is associated with a flare event.\r\n"
+    "ALERT: Electron 2MeV Integral Flux exceeded 1000pfu\r\n"
+    "Yesterday Maximum 2MeV Flux:  pfu\r\n"
+    "WATCH: Geomagnetic Storm Category G1 Predicted\r\n"
+    "Highest Storm Level Predicted by Day:\r\n"
+    "EXTENDED WARNING: Geomagnetic K-index of 4 expected\r\nExtension to Serial Number: \r\n"
+    "Now Valid Until: \r\n"
+    "WARNING: Geomagnetic K-index of 4 expected\r\nWarning Condition: Onset\r\n"
+    "Warning Condition: Persistence\r\n"
+    "ALERT: Geomagnetic K-index of 5\r\nThreshold Reached: \r\nSynoptic Period: 0000-0300 UTC\r\n"
+    "Active Warning: Yes\r\nNOAA Scale: G1 - Minor\r\nNOAA Scale: G2 - Moderate\r\n"
+    "Begin Time: \r\nValid From: 2024 May 10 1200 UTC\r\nValid To: 2024 May 10 2100 UTC\r\n"
+    "Space Weather Message Code: ALTK05\r\nSerial Number: \r\nIssue Time: 2024 May 10 1734 UTC\r\n"
+    "NOAA Space Weather Scale descriptions can be found at www.swpc.noaa.gov/noaa-scales-explanation\r\n"
+).encode('utf-8')
+
+_RAW = b'\x00'
+_DEFLATE = b'\x01'
+_MAGIC = b'SWMS2'
+
+
+def _digest(data: bytes) -> int:
+    """Non-zero 64-bit dedup key, so the plaintext doesn't have to stay in memory"""
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), 'little') or 1
+
+
+def _pack_ids(ids: array) -> bytes:
+    """Line ids as little-endian u32, whatever the host byte order"""
+    return struct.pack(f'<{len(ids)}I', *ids)
+
+
+class _DigestIndex:
+    """
+    Map from 64-bit digests to ids in two flat arrays
+
+    Open addressing with linear probing; 0 marks an empty slot. Costs
+    about 20-40 bytes per entry against ~100 for a dict of Python ints.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        self._keys = array('Q', bytes(8 * capacity))
+        self._values = array('I', bytes(4 * capacity))
+        self._mask = capacity - 1
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def nbytes(self) -> int:
+        return sys.getsizeof(self._keys) + sys.getsizeof(self._values)
+
+    def get(self, key: int) -> Optional[int]:
+        slot = key & self._mask
+        while True:
+            found = self._keys[slot]
+            if found == key:
+                return self._values[slot]
+            if found == 0:
+                return None
+            slot = (slot + 1) & self._mask
+
+    def put(self, key: int, value: int):
+        # Keep the load factor under 2/3
+        if 3 * (self._size + 1) > 2 * len(self._keys):
+            self._grow()
+        slot = key & self._mask
+        while self._keys[slot] not in (0, key):
+            slot = (slot + 1) & self._mask
+        if self._keys[slot] == 0:
+            self._size += 1
+        self._keys[slot] = key
+        self._values[slot] = value
+
+    def items(self):
+        return ((key, value) for key, value in zip(self._keys, self._values) if key)
+
+    def _grow(self):
+        old_items = list(self.items())
+        self.__init__(2 * len(self._keys))
+        for key, value in old_items:
+            self.put(key, value)
+
+
+class MessageStore:
+    """
+    Message body store with line-level deduplication
+
+    `add` returns a body id; `get` rebuilds the body on demand. Distinct
+    lines are compressed individually with raw deflate and a preset
+    dictionary, which works well for short, highly repetitive lines.
+    Compressed lines and body line ids live in flat buffers, and both
+    dedup maps are flat tables keyed by 64-bit BLAKE2b digests rather than
+    by text, so memory use follows `stored_bytes` (see `memory_bytes`).
+    """
+
+    def __init__(self, dictionary: bytes = DEFAULT_DICTIONARY, level: int = 9):
+        self.dictionary = dictionary
+        self.level = level
+        # Compressed line i is _segment_data[_segment_offsets[i]:_segment_offsets[i + 1]]
+        self._segment_data = bytearray()
+        self._segment_offsets = array('I', [0])
+        self._segment_ids = _DigestIndex()
+        # Body i is made of lines _body_lines[_body_offsets[i]:_body_offsets[i + 1]]
+        self._body_lines = array('I')
+        self._body_offsets = array('I', [0])
+        self._body_ids = _DigestIndex()
+        self._lock = threading.Lock()
+        self.raw_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._body_offsets) - 1
+
+    @property
+    def stored_bytes(self) -> int:
+        """Size of the stored data (compressed lines plus body line ids)"""
+        return len(self._segment_data) + self._body_lines.itemsize * len(self._body_lines)
+
+    @property
+    def memory_bytes(self) -> int:
+        """In-memory size of the store, including offsets and dedup tables"""
+        return (sum(sys.getsizeof(buffer) for buffer in (
+                    self._segment_data, self._segment_offsets, self._body_lines, self._body_offsets))
+                + self._segment_ids.nbytes + self._body_ids.nbytes)
+
+    @classmethod
+    def train(cls, samples: Iterable[str], size: int = 16384, level: int = 9) -> 'MessageStore':
+        """
+        Create an empty store whose dictionary is built from sample bodies
+
+        The most frequent lines are packed into the dictionary, most common
+        last, up to `size` bytes.
+        """
+        counts = Counter(
+            line for sample in samples for line in sample.splitlines(keepends=True) if line.strip()
+        )
+        chosen = []
+        total = 0
+        for line, _ in counts.most_common():
+            encoded = line.encode('utf-8')
+            if total + len(encoded) > size:
+                break
+            chosen.append(encoded)
+            total += len(encoded)
+        return cls(b''.join(reversed(chosen)) or DEFAULT_DICTIONARY, level)
+
+    def _compress(self, data: bytes) -> bytes:
+        compressor = zlib.compressobj(self.level, zlib.DEFLATED, -15, zdict=self.dictionary)
+        compressed = compressor.compress(data) + compressor.flush()
+        if len(compressed) < len(data):
+            return _DEFLATE + compressed
+        return _RAW + data
+
+    def _decompress(self, segment: bytes) -> bytes:
+        if segment[:1] == _RAW:
+            return segment[1:]
+        decompressor = zlib.decompressobj(-15, zdict=self.dictionary)
+        return decompressor.decompress(segment[1:]) + decompressor.flush()
+
+    def _segment(self, segment_id: int) -> bytes:
+        return bytes(self._segment_data[self._segment_offsets[segment_id]:self._segment_offsets[segment_id + 1]])
+
+    def _append_segment(self, key: int, segment: bytes) -> int:
+        segment_id = len(self._segment_offsets) - 1
+        self._segment_data += segment
+        self._segment_offsets.append(len(self._segment_data))
+        self._segment_ids.put(key, segment_id)
+        return segment_id
+
+    def _append_body(self, key: int, ids: array) -> int:
+        body_id = len(self._body_offsets) - 1
+        self._body_lines.extend(ids)
+        self._body_offsets.append(len(self._body_lines))
+        self._body_ids.put(key, body_id)
+        return body_id
+
+    def add(self, text: str) -> int:
+        """Store a message body and return its id"""
+        with self._lock:
+            ids = array('I')
+            for line in text.splitlines(keepends=True):
+                encoded = line.encode('utf-8')
+                key = _digest(encoded)
+                segment_id = self._segment_ids.get(key)
+                if segment_id is None:
+                    segment_id = self._append_segment(key, self._compress(encoded))
+                ids.append(segment_id)
+                # Every add counts, so raw_bytes / stored_bytes is the real saving
+                self.raw_bytes += len(encoded)
+
+            key = _digest(_pack_ids(ids))
+            body_id = self._body_ids.get(key)
+            if body_id is None:
+                body_id = self._append_body(key, ids)
+            return body_id
+
+    def get(self, body_id: int) -> str:
+        """Rebuild a message body"""
+        if not 0 <= body_id < len(self):
+            raise IndexError(f"No message body {body_id}")
+        start, end = self._body_offsets[body_id], self._body_offsets[body_id + 1]
+        return b''.join(
+            self._decompress(self._segment(segment_id)) for segment_id in self._body_lines[start:end]
+        ).decode('utf-8')
+
+    def save(self, path: Path):
+        """Write the store to disk (segments stay compressed, integers little-endian)"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock, open(path, 'wb') as f:
+            f.write(_MAGIC)
+            f.write(struct.pack('<BQI', self.level, self.raw_bytes, len(self.dictionary)))
+            f.write(self.dictionary)
+
+            digests = array('Q', bytes(8 * (len(self._segment_offsets) - 1)))
+            for key, segment_id in self._segment_ids.items():
+                digests[segment_id] = key
+            f.write(struct.pack('<I', len(digests)))
+            for segment_id, key in enumerate(digests):
+                segment = self._segment(segment_id)
+                f.write(struct.pack('<QI', key, len(segment)))
+                f.write(segment)
+
+            f.write(struct.pack('<I', len(self)))
+            for body_id in range(len(self)):
+                ids = self._body_lines[self._body_offsets[body_id]:self._body_offsets[body_id + 1]]
+                f.write(struct.pack('<I', len(ids)))
+                f.write(_pack_ids(ids))
+
+    @classmethod
+    def load(cls, path: Path) -> 'MessageStore':
+        """Read a store written by save(); segments are not decompressed"""
+        data = Path(path).read_bytes()
+        if data[:len(_MAGIC)] != _MAGIC:
+            raise ValueError(f"Not a message store file: {path}")
+
+        offset = len(_MAGIC)
+
+        def read_u32() -> int:
+            nonlocal offset
+            value, = struct.unpack_from('<I', data, offset)
+            offset += 4
+            return value
+
+        level, raw_bytes = struct.unpack_from('<BQ', data, offset)
+        offset += 9
+        dict_len = read_u32()
+        store = cls(data[offset:offset + dict_len], level)
+        store.raw_bytes = raw_bytes
+        offset += dict_len
+
+        for _ in range(read_u32()):
+            key, length = struct.unpack_from('<QI', data, offset)
+            offset += 12
+            store._append_segment(key, data[offset:offset + length])
+            offset += length
+
+        for _ in range(read_u32()):
+            count = read_u32()
+            packed = data[offset:offset + count * 4]
+            offset += count * 4
+            store._append_body(_digest(packed), array('I', struct.unpack(f'<{count}I', packed)))
+
+        return store
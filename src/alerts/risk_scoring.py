@@ -0,0 +1,99 @@
+"""
+Per-location health risk scoring by geomagnetic latitude
+Storm effects reach further from the poles as Kp rises, so the same
+G-level matters in St. Petersburg and hardly at all near the equator
+"""
+
+import numpy as np
+from typing import Tuple
+from .alert_models import AlertSeverity
+
+
+# Geomagnetic north pole (centered dipole, IGRF-13 epoch 2020)
+DIPOLE_POLE_LAT = 80.65
+DIPOLE_POLE_LON = -72.68
+
+# Degrees of geomagnetic latitude per severity level outside the impact area
+LEVEL_STEP_DEGREES = 5.0
+
+
+def geomagnetic_latitude(lat, lon) -> np.ndarray:
+    """Convert geographic coordinates (degrees) to dipole geomagnetic latitude"""
+    lat = np.radians(np.asarray(lat, dtype=np.float64))
+    lon = np.radians(np.asarray(lon, dtype=np.float64))
+    pole_lat = np.radians(DIPOLE_POLE_LAT)
+    pole_lon = np.radians(DIPOLE_POLE_LON)
+
+    sin_mlat = (np.sin(lat) * np.sin(pole_lat)
+                + np.cos(lat) * np.cos(pole_lat) * np.cos(lon - pole_lon))
+    return np.degrees(np.arcsin(np.clip(sin_mlat, -1.0, 1.0)))
+
+
+def impact_boundary(kp) -> np.ndarray:
+    """
+    Equatorward edge of the main impact area in geomagnetic latitude
+
+    Follows the SWPC "poleward of N degrees" guidance: 60° at Kp 5 (G1)
+    moving 5° towards the equator per Kp step, down to 40° at Kp 9 (G5).
+    """
+    kp = np.asarray(kp, dtype=np.float64)
+    return np.clip(85.0 - 5.0 * kp, 40.0, 90.0)
+
+
+def storm_level(kp) -> np.ndarray:
+    """NOAA G-scale level (0-5) for a Kp value"""
+    kp = np.asarray(kp, dtype=np.float64)
+    return np.clip(np.floor(kp) - 4, 0, 5).astype(np.int8)
+
+
+class LocationRiskScorer:
+    """
+    Scores geomagnetic storm risk for a fixed set of locations
+
+    Geomagnetic latitudes are computed once; scoring a Kp value (or a
+    forecast series of them) is then one vectorized NumPy pass. Inside the
+    impact area a location gets the storm's G-level; every
+    LEVEL_STEP_DEGREES further towards the equator lowers it by one.
+    """
+
+    def __init__(self, lat, lon):
+        self.lat = np.asarray(lat, dtype=np.float64)
+        self.lon = np.asarray(lon, dtype=np.float64)
+        self.abs_mlat = np.abs(geomagnetic_latitude(self.lat, self.lon))
+
+    def __len__(self) -> int:
+        return self.abs_mlat.size
+
+    def _continuous_levels(self, kp) -> np.ndarray:
+        """Unrounded risk levels; Kp arrays add leading dimensions"""
+        kp = np.asarray(kp, dtype=np.float64)
+        expand = (Ellipsis,) + (None,) * self.abs_mlat.ndim
+        level = storm_level(kp)[expand].astype(np.float64)
+        boundary = impact_boundary(kp)[expand]
+
+        distance = np.maximum(boundary - self.abs_mlat, 0.0)
+        return np.clip(level - distance / LEVEL_STEP_DEGREES, 0.0, None)
+
+    def scores(self, kp) -> np.ndarray:
+        """Continuous risk in [0, 1] (1 = G5 inside the impact area)"""
+        return self._continuous_levels(kp) / AlertSeverity.EXTREME.value
+
+    def levels(self, kp) -> np.ndarray:
+        """Risk levels as AlertSeverity values (0-5)"""
+        return np.ceil(self._continuous_levels(kp)).astype(np.int8)
+
+    def dangerous(self, kp, threshold: AlertSeverity = AlertSeverity.STRONG) -> np.ndarray:
+        """Mask of locations at or above the health threshold (G3 by default)"""
+        return self.levels(kp) >= threshold.value
+
+
+def global_grid(resolution: float = 1.0) -> Tuple[np.ndarray, np.ndarray]:
+    """Latitude/longitude meshgrid covering the globe for risk maps"""
+    lats = np.arange(-90.0, 90.0 + resolution / 2, resolution)
+    lons = np.arange(-180.0, 180.0, resolution)
+    return np.meshgrid(lats, lons, indexing='ij')
+
+
+def score_locations(kp, lat, lon) -> np.ndarray:
+    """Quick function to get risk levels for locations"""
+    return LocationRiskScorer(lat, lon).levels(kp)
@@ -0,0 +1,7 @@
+"""
+Cross-process coordination for multi-worker deployments
+"""
+
+from .coordinator import LeaderLease, SharedCache, FetchCoordinator
+
+__all__ = ['LeaderLease', 'SharedCache', 'FetchCoordinator']
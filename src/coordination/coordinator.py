@@ -0,0 +1,239 @@
+"""
+Leader election and shared alert cache over SQLite
+One elected worker fetches from NOAA and translates; every other worker
+reads the published results, so upstream load doesn't grow with workers
+"""
+
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+
+DEFAULT_DB_PATH = Path(__file__).parent.parent.parent / 'data' / 'coordination.db'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS lease (
+    name TEXT PRIMARY KEY,
+    holder TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS cache (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    updated_at REAL NOT NULL
+);
+"""
+
+
+def _connect(db_path: Path) -> sqlite3.Connection:
+    """Open the coordination database (autocommit, WAL for concurrent readers)"""
+    db_path = Path(db_path)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(db_path), timeout=10, isolation_level=None, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(_SCHEMA)
+    return conn
+
+
+class LeaderLease:
+    """
+    Time-limited leadership lease stored in SQLite
+
+    The holder must renew the lease (try_acquire) before `ttl` seconds
+    pass; if it dies, the lease expires and another worker takes over.
+    """
+
+    def __init__(self, db_path: Path = DEFAULT_DB_PATH, name: str = 'noaa-fetcher', ttl: float = 30.0):
+        self.name = name
+        self.ttl = ttl
+        self.holder_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._conn = _connect(db_path)
+        self._lock = threading.Lock()
+
+    def try_acquire(self) -> bool:
+        """Acquire or renew the lease; returns True if this worker is leader"""
+        now = time.time()
+        with self._lock:
+            try:
+                self._conn.execute("BEGIN IMMEDIATE")
+                row = self._conn.execute(
+                    "SELECT holder, expires_at FROM lease WHERE name = ?", (self.name,)
+                ).fetchone()
+                if row is None or row[0] == self.holder_id or row[1] < now:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO lease (name, holder, expires_at) VALUES (?, ?, ?)",
+                        (self.name, self.holder_id, now + self.ttl)
+                    )
+                    self._conn.execute("COMMIT")
+                    return True
+                self._conn.execute("COMMIT")
+                return False
+            except sqlite3.Error as e:
+                print(f"Lease error: {e}")
+                if self._conn.in_transaction:
+                    self._conn.execute("ROLLBACK")
+                return False
+
+    def release(self):
+        """Give up the lease so another worker can take over immediately"""
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM lease WHERE name = ? AND holder = ?", (self.name, self.holder_id)
+            )
+
+    def current_holder(self) -> Optional[str]:
+        """Holder of an unexpired lease, if any"""
+        row = self._conn.execute(
+            "SELECT holder FROM lease WHERE name = ? AND expires_at >= ?", (self.name, time.time())
+        ).fetchone()
+        return row[0] if row else None
+
+
+class SharedCache:
+    """
+    Versioned JSON values shared between processes through SQLite
+
+    Readers keep the last decoded value and only decode again when the
+    version changes.
+    """
+
+    def __init__(self, db_path: Path = DEFAULT_DB_PATH):
+        self._conn = _connect(db_path)
+        self._lock = threading.Lock()
+        self._local: Dict[str, Tuple[int, Any, float]] = {}
+
+    def publish(self, key: str, value: Any) -> int:
+        """Store a new value and return its version"""
+        encoded = json.dumps(value, ensure_ascii=False, default=str)
+        with self._lock:
+            try:
+                self._conn.execute("BEGIN IMMEDIATE")
+                row = self._conn.execute("SELECT version FROM cache WHERE key = ?", (key,)).fetchone()
+                version = (row[0] if row else 0) + 1
+                updated_at = time.time()
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO cache (key, value, version, updated_at) VALUES (?, ?, ?, ?)",
+                    (key, encoded, version, updated_at)
+                )
+                self._conn.execute("COMMIT")
+            except sqlite3.Error:
+                if self._conn.in_transaction:
+                    self._conn.execute("ROLLBACK")
+                raise
+            self._local[key] = (version, value, updated_at)
+            return version
+
+    def get(self, key: str) -> Tuple[Optional[Any], int, Optional[float]]:
+        """Get (value, version, updated_at); version 0 means nothing was published"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT version, updated_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None, 0, None
+
+            version, updated_at = row
+            cached = self._local.get(key)
+            if cached is None or cached[0] != version:
+                value_row = self._conn.execute(
+                    "SELECT value, version, updated_at FROM cache WHERE key = ?", (key,)
+                ).fetchone()
+                cached = (value_row[1], json.loads(value_row[0]), value_row[2])
+                self._local[key] = cached
+
+            return cached[1], cached[0], cached[2]
+
+
+class FetchCoordinator:
+    """
+    Coordinates NOAA fetching and translation across worker processes
+
+    Every worker calls poll(). The lease holder fetches, processes and
+    translates at most once per `poll_interval` and publishes the result;
+    other workers read it from the shared cache. If the leader stops
+    renewing its lease, the next worker to poll after `lease_ttl` takes
+    over.
+    """
+
+    CACHE_KEY = 'processed_alerts'
+
+    def __init__(self,
+                 db_path: Path = DEFAULT_DB_PATH,
+                 poll_interval: float = 60.0,
+                 lease_ttl: Optional[float] = None,
+                 languages: Optional[List[str]] = None,
+                 fetcher=None):
+        self.poll_interval = poll_interval
+        self.languages = languages
+        self.lease = LeaderLease(db_path, ttl=lease_ttl or poll_interval * 3)
+        self.cache = SharedCache(db_path)
+        self._fetcher = fetcher
+        self._processor = None
+
+    @property
+    def is_leader(self) -> bool:
+        return self.lease.current_holder() == self.lease.holder_id
+
+    def _refresh(self) -> Dict:
+        """Fetch, process and translate (leader only)"""
+        # Imported lazily so followers never create a session or translator
+        if self._fetcher is None:
+            from ..data_ingestion.noaa_api import NOAADataFetcher
+            self._fetcher = NOAADataFetcher()
+        if self._processor is None:
+            from ..alerts.alert_processor import AlertProcessor
+            self._processor = AlertProcessor()
+
+        alerts = self._fetcher.get_alerts()
+        if self.languages:
+            processed = self._processor.process_alerts_multi(alerts, self.languages)
+        else:
+            processed = self._processor.process_alerts(alerts, translate=True)
+        return {
+            'fetched_at': time.time(),
+            'is_stale': self._fetcher.is_stale,
+            'last_error': self._fetcher.last_error,
+            'alerts': processed,
+        }
+
+    def poll(self) -> Optional[Dict]:
+        """
+        Get the latest processed alerts
+
+        Returns the published payload: fetched_at, is_stale, last_error and
+        alerts (a list of alert dicts, or {language: list} when languages
+        are set). None if nothing has been published yet.
+
+        A failed refresh returns the last published payload, and the next
+        poll tries again. A failed publish still returns the fresh payload
+        to this worker.
+        """
+        payload, _, updated_at = self.cache.get(self.CACHE_KEY)
+        fresh = updated_at is not None and time.time() - updated_at < self.poll_interval
+
+        if not fresh and self.lease.try_acquire():
+            try:
+                refreshed = self._refresh()
+            except Exception as e:
+                print(f"Alert refresh failed: {e}")
+                return payload
+
+            try:
+                self.cache.publish(self.CACHE_KEY, refreshed)
+            except sqlite3.Error as e:
+                print(f"Publishing alerts failed: {e}")
+            payload = refreshed
+
+        return payload
+
+    def close(self):
+        """Release leadership (e.g. on shutdown)"""
+        self.lease.release()
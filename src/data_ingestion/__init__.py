@@ -3,6 +3,6 @@ Data ingestion module for NASA/NOAA space weather data
 """
 
 from .noaa_api import NOAADataFetcher, fetch_noaa_alerts
+from .resilience import CircuitBreaker, CircuitState, SnapshotStore
 
-__all__ = ['NOAADataFetcher', 'fetch_noaa_alerts']
-
+__all__ = ['NOAADataFetcher', 'fetch_noaa_alerts', 'CircuitBreaker', 'CircuitState', 'SnapshotStore']
@@ -3,42 +3,115 @@ NOAA Space Weather API data ingestion
 Fetches real-time space weather data for alert system
 """
 
+import os
 import requests
 import re
-from datetime import datetime
+from datetime import datetime, timedelta
+from pathlib import Path
 from typing import List, Dict, Optional
 from typing import TYPE_CHECKING
 
+from .resilience import CircuitBreaker, SnapshotStore
+
 if TYPE_CHECKING:
-    from ..alerts.alert_models import GeomagneticAlert, ForecastAlert, Alert
+    from ..alerts.alert_models import GeomagneticAlert, ForecastAlert, Alert, utc_now
+    from ..alerts.message_store import MessageStore
 else:
     # Runtime import
     import sys
-    from pathlib import Path
     sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-    from src.alerts.alert_models import GeomagneticAlert, ForecastAlert, Alert
+    from src.alerts.alert_models import GeomagneticAlert, ForecastAlert, Alert, utc_now
+
+
+# Can be pointed at a local stand-in server (see src/simulation)
+DEFAULT_BASE_URL = os.environ.get('SWPC_BASE_URL', "https://services.swpc.noaa.gov")
+
+DEFAULT_SNAPSHOT_PATH = Path(__file__).parent.parent.parent / 'data' / 'wwv_snapshot.txt'
+
+# SWPC timestamp, e.g. "2024 May 10 1734 UTC"
+TIME_PATTERN = r'(\d{4}\s+\w{3}\s+\d{1,2}\s+\d{4}\s+UTC)'
+
+
+def parse_swpc_time(text: Optional[str]) -> Optional[datetime]:
+    """Parse an SWPC timestamp, returning None if it can't be read"""
+    if not text:
+        return None
+    match = re.search(TIME_PATTERN, text)
+    if not match:
+        return None
+    try:
+        return datetime.strptime(' '.join(match.group(1).split()), "%Y %b %d %H%M UTC")
+    except ValueError:
+        return None
 
 
 class NOAADataFetcher:
     """Fetches data from NOAA Space Weather Prediction Center"""
     
-    def __init__(self):
-        self.base_url = "https://services.swpc.noaa.gov/text"
-        self.alerts_url = f"{self.base_url}/wwv.txt"
+    def __init__(self,
+                 base_url: str = DEFAULT_BASE_URL,
+                 snapshot_path: Optional[Path] = None,
+                 breaker: Optional[CircuitBreaker] = None,
+                 message_store: Optional['MessageStore'] = None):
+        self.base_url = base_url.rstrip('/')
+        self.alerts_url = f"{self.base_url}/text/wwv.txt"
+        self.timeout = 10
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'SolarWind-Dashboard/1.0'
         })
+        
+        # Outage handling: fail fast and fall back to last-known-good data
+        self.breaker = breaker or CircuitBreaker()
+        self.snapshots = SnapshotStore(snapshot_path or DEFAULT_SNAPSHOT_PATH)
+        self.is_stale = False
+        self.data_age: Optional[timedelta] = None
+        self.last_error: Optional[str] = None
+        
+        # Optional deduplicated storage for message bodies
+        self.message_store = message_store
     
     def fetch_alerts(self) -> str:
-        """Fetch space weather alerts from NOAA"""
+        """
+        Fetch space weather alerts from NOAA
+        
+        Falls back to the last-known-good snapshot when the request fails
+        or the circuit breaker is open; `is_stale` and `data_age` describe
+        what was returned. `last_error` keeps the last upstream error while
+        the circuit is open (see `breaker.state`).
+        """
+        if not self.breaker.allow_request():
+            return self._serve_snapshot()
+        
         try:
-            response = self.session.get(self.alerts_url, timeout=10)
+            response = self.session.get(self.alerts_url, timeout=self.timeout)
             response.raise_for_status()
-            return response.text
         except Exception as e:
             print(f"Error fetching NOAA alerts: {e}")
+            self.breaker.record_failure()
+            self.last_error = str(e)
+            return self._serve_snapshot()
+        
+        self.breaker.record_success()
+        # An empty body or an error page must not replace good data
+        if self.has_alerts(response.text):
+            self.snapshots.save(response.text)
+        self.is_stale = False
+        self.data_age = None
+        self.last_error = None
+        return response.text
+    
+    def _serve_snapshot(self) -> str:
+        """Return the last-known-good snapshot text, or "" if there is none"""
+        snapshot = self.snapshots.load()
+        if snapshot is None:
+            self.is_stale = False
+            self.data_age = None
             return ""
+        
+        self.is_stale = True
+        self.data_age = snapshot.age
+        return snapshot.text
     
     def parse_alert_message(self, message: str) -> Optional[Dict]:
         """Parse alert message into structured data"""
@@ -54,17 +127,12 @@ class NOAADataFetcher:
         serial_number = code_match.group(2)
         
         # Extract issue time
-        time_match = re.search(r'Issue Time:\s*(\d{4}\s+\w{3}\s+\d{2}\s+\d{4}\s+UTC)', message)
-        issue_time = None
-        if time_match:
-            try:
-                time_str = time_match.group(1)
-                issue_time = datetime.strptime(time_str, "%Y %b %d %H%M UTC")
-            except:
-                pass
+        time_match = re.search(r'Issue Time:\s*([^\r\n]+)', message)
+        issue_time = parse_swpc_time(time_match.group(1)) if time_match else None
         
         if not issue_time:
-            issue_time = datetime.now()
+            # SWPC times are UTC; a local fallback would shift validity windows
+            issue_time = utc_now()
         
         # Extract warning type
         alert_match = re.search(r'ALERT:\s*([^\r\n]+)', message)
@@ -83,8 +151,10 @@ class NOAADataFetcher:
         if base_data['message_code'].startswith('K'):
             # Extract K-index specific data
             valid_from_match = re.search(r'Valid From:\s*([^\r\n]+)', message)
-            valid_to_match = re.search(r'Valid To:\s*([^\r\n]+)', message)
+            valid_to_match = re.search(r'(?:Valid To|Now Valid Until):\s*([^\r\n]+)', message)
             begin_match = re.search(r'Begin Time:\s*([^\r\n]+)', message)
+            extends_match = re.search(r'Extension to Serial Number:\s*(\d+)', message)
+            cancels_match = re.search(r'Cancel Serial Number:\s*(\d+)', message)
             condition_match = re.search(r'Warning Condition:\s*([^\r\n]+)', message)
             scale_match = re.search(r'NOAA Scale:\s*([^\r\n]+)', message)
             impacts_match = re.search(r'Potential Impacts:\s*([^\r\n]+)', message, re.DOTALL)
@@ -95,6 +165,11 @@ class NOAADataFetcher:
                 issue_time=base_data['issue_time'],
                 warning_type=base_data['warning_type'],
                 full_message=base_data['full_message'],
+                valid_from=parse_swpc_time(valid_from_match.group(1)) if valid_from_match else None,
+                valid_to=parse_swpc_time(valid_to_match.group(1)) if valid_to_match else None,
+                begin_time=parse_swpc_time(begin_match.group(1)) if begin_match else None,
+                extends_serial=extends_match.group(1) if extends_match else None,
+                cancels_serial=cancels_match.group(1) if cancels_match else None,
                 noaa_scale=scale_match.group(1).strip() if scale_match else None,
                 potential_impacts=impacts_match.group(1).strip() if impacts_match else None,
                 warning_condition=condition_match.group(1).strip() if condition_match else None
@@ -108,11 +183,28 @@ class NOAADataFetcher:
         if not alerts_text:
             return []
         
-        # Split into individual messages
-        messages = re.split(r'\n\n+', alerts_text)
+        alerts = self.parse_alerts(alerts_text)
+        if self.is_stale:
+            for alert in alerts:
+                alert.is_stale = True
+                alert.data_age = self.data_age
+        
+        return alerts
+    
+    @staticmethod
+    def _split_messages(alerts_text: str) -> List[str]:
+        """Split a wwv.txt payload into individual messages"""
+        return re.split(r'\n\n+', alerts_text)
+    
+    def has_alerts(self, alerts_text: str) -> bool:
+        """Check whether a payload contains at least one parseable alert"""
+        return any(self.parse_alert_message(message) for message in self._split_messages(alerts_text))
+    
+    def parse_alerts(self, alerts_text: str) -> List[Alert]:
+        """Parse a wwv.txt payload into alerts"""
         alerts = []
         
-        for message in messages:
+        for message in self._split_messages(alerts_text):
             base_data = self.parse_alert_message(message)
             if not base_data:
                 continue
@@ -131,11 +223,18 @@ class NOAADataFetcher:
                     full_message=base_data['full_message']
                 ))
         
+        if self.message_store is not None:
+            for alert in alerts:
+                alert.store_message(self.message_store)
+        
         return alerts
 
 
+# Global fetcher instance (keeps circuit breaker state between polls)
+fetcher = NOAADataFetcher()
+
+
 def fetch_noaa_alerts() -> List[Alert]:
     """Quick function to fetch NOAA alerts"""
-    fetcher = NOAADataFetcher()
     return fetcher.get_alerts()
 
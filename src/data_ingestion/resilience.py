@@ -0,0 +1,144 @@
+"""
+Resilience helpers for NOAA data ingestion
+Circuit breaker and last-known-good snapshot storage
+"""
+
+import mmap
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+from enum import Enum
+from pathlib import Path
+from typing import Optional
+
+
+class CircuitState(Enum):
+    """Circuit breaker states"""
+    CLOSED = "closed"        # Requests go through normally
+    OPEN = "open"            # Requests fail fast without touching the network
+    HALF_OPEN = "half_open"  # A single probe request is allowed through
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for upstream requests
+
+    After `failure_threshold` consecutive failures the circuit opens and
+    requests are rejected immediately. Once `reset_timeout` seconds have
+    passed, one probe request is let through (half-open): success closes
+    the circuit, failure opens it again for another `reset_timeout`.
+    """
+
+    def __init__(self, failure_threshold: int = 3, reset_timeout: float = 60.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failure_count = 0
+        self.opened_at = 0.0
+        self._state = CircuitState.CLOSED
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state, moving OPEN -> HALF_OPEN once the timeout expires"""
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> CircuitState:
+        if (self._state == CircuitState.OPEN
+                and time.monotonic() - self.opened_at >= self.reset_timeout):
+            self._state = CircuitState.HALF_OPEN
+            self._probe_in_flight = False
+        return self._state
+
+    def allow_request(self) -> bool:
+        """Check whether a request may be sent upstream"""
+        with self._lock:
+            state = self._current_state()
+            if state == CircuitState.CLOSED:
+                return True
+            if state == CircuitState.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            return False
+
+    def record_success(self):
+        """Record a successful request and close the circuit"""
+        with self._lock:
+            self.failure_count = 0
+            self._probe_in_flight = False
+            self._state = CircuitState.CLOSED
+
+    def record_failure(self):
+        """Record a failed request, opening the circuit if needed"""
+        with self._lock:
+            self.failure_count += 1
+            self._probe_in_flight = False
+            if (self._state == CircuitState.HALF_OPEN
+                    or self.failure_count >= self.failure_threshold):
+                self._state = CircuitState.OPEN
+                self.opened_at = time.monotonic()
+
+
+class Snapshot:
+    """Last-known-good payload, memory-mapped and decoded on first access"""
+
+    def __init__(self, path: Path, saved_at: datetime):
+        self.path = path
+        self.saved_at = saved_at
+        self._text: Optional[str] = None
+
+    @property
+    def age(self) -> timedelta:
+        """Time elapsed since the snapshot was saved"""
+        return datetime.now() - self.saved_at
+
+    @property
+    def text(self) -> str:
+        """Snapshot contents (read lazily through mmap)"""
+        if self._text is None:
+            with open(self.path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    self._text = ""
+                else:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        self._text = mm[:].decode('utf-8', errors='replace')
+        return self._text
+
+
+class SnapshotStore:
+    """Stores the last successful NOAA response on disk"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._snapshot: Optional[Snapshot] = None
+        self._snapshot_mtime: Optional[float] = None
+
+    def save(self, text: str):
+        """Atomically replace the snapshot with fresh data"""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(self.path.suffix + '.tmp')
+            tmp_path.write_bytes(text.encode('utf-8'))
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"Error saving NOAA snapshot: {e}")
+            return
+
+        self._snapshot = None
+        self._snapshot_mtime = None
+
+    def load(self) -> Optional[Snapshot]:
+        """Get the last-known-good snapshot, or None if there is none"""
+        try:
+            mtime = self.path.stat().st_mtime
+        except OSError:
+            return None
+
+        # Reuse the same Snapshot while the file is unchanged so repeated
+        # polls during an outage don't touch the disk again
+        if self._snapshot is None or self._snapshot_mtime != mtime:
+            self._snapshot = Snapshot(self.path, datetime.fromtimestamp(mtime))
+            self._snapshot_mtime = mtime
+        return self._snapshot
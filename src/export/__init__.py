@@ -0,0 +1,7 @@
+"""
+Export of processed alerts to NDJSON, Parquet and Arrow
+"""
+
+from .alert_export import ALERT_SCHEMA, write_ndjson, write_parquet, write_arrow, read_alerts
+
+__all__ = ['ALERT_SCHEMA', 'write_ndjson', 'write_parquet', 'write_arrow', 'read_alerts']
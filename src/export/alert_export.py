@@ -0,0 +1,206 @@
+"""
+Streaming export of processed alerts
+Writes alerts in bounded-size chunks with a stable schema, so a long
+history never has to be built in memory
+"""
+
+import json
+from datetime import datetime
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Union
+
+from ..alerts.alert_models import Alert
+
+
+# Stable export schema: column name -> type
+ALERT_SCHEMA = [
+    ('message_code', 'string'),
+    ('serial_number', 'string'),
+    ('issue_time', 'timestamp'),
+    ('warning_type', 'string'),
+    ('noaa_scale', 'string'),
+    ('warning_condition', 'string'),
+    ('valid_from', 'timestamp'),
+    ('valid_to', 'timestamp'),
+    ('begin_time', 'timestamp'),
+    ('severity', 'string'),
+    ('is_dangerous', 'bool'),
+    ('health_impact', 'string'),
+    ('is_stale', 'bool'),
+    ('data_age_seconds', 'float'),
+    ('full_message', 'string'),
+]
+
+DEFAULT_CHUNK_SIZE = 10000
+
+AlertRecord = Union[Alert, Dict[str, Any]]
+
+
+def _to_datetime(value) -> Any:
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    return value
+
+
+def alert_to_row(alert: AlertRecord) -> Dict[str, Any]:
+    """Convert an Alert or processed alert dict into a schema row"""
+    if isinstance(alert, Alert):
+        row = {
+            'message_code': alert.message_code,
+            'serial_number': alert.serial_number,
+            'issue_time': alert.issue_time,
+            'warning_type': alert.warning_type,
+            'noaa_scale': getattr(alert, 'noaa_scale', None),
+            'warning_condition': getattr(alert, 'warning_condition', None),
+            'valid_from': getattr(alert, 'valid_from', None),
+            'valid_to': getattr(alert, 'valid_to', None),
+            'begin_time': getattr(alert, 'begin_time', None),
+            'severity': alert.get_severity().name,
+            'is_dangerous': alert.is_dangerous_for_health(),
+            'health_impact': alert.get_health_impact(),
+            'is_stale': alert.is_stale,
+            'data_age_seconds': alert.data_age.total_seconds() if alert.data_age else None,
+            'full_message': alert.full_message,
+        }
+    else:
+        row = {name: alert.get(name) for name, _ in ALERT_SCHEMA}
+
+    for name, column_type in ALERT_SCHEMA:
+        if column_type == 'timestamp':
+            row[name] = _to_datetime(row[name])
+    return row
+
+
+def _chunks(alerts: Iterable[AlertRecord], chunk_size: int) -> Iterator[List[Dict[str, Any]]]:
+    """Yield lists of at most chunk_size rows"""
+    iterator = iter(alerts)
+    while True:
+        chunk = [alert_to_row(alert) for alert in islice(iterator, chunk_size)]
+        if not chunk:
+            return
+        yield chunk
+
+
+def write_ndjson(alerts: Iterable[AlertRecord], path: Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """Stream alerts to a newline-delimited JSON file, returning the row count"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    count = 0
+
+    with open(path, 'w', encoding='utf-8') as f:
+        for chunk in _chunks(alerts, chunk_size):
+            lines = []
+            for row in chunk:
+                for name, column_type in ALERT_SCHEMA:
+                    if column_type == 'timestamp' and row[name] is not None:
+                        row[name] = row[name].isoformat()
+                lines.append(json.dumps(row, ensure_ascii=False))
+            f.write('\n'.join(lines) + '\n')
+            count += len(chunk)
+
+    return count
+
+
+def _arrow_schema():
+    import pyarrow as pa
+
+    types = {
+        'string': pa.string(),
+        'timestamp': pa.timestamp('us'),
+        'bool': pa.bool_(),
+        'float': pa.float64(),
+    }
+    return pa.schema([(name, types[column_type]) for name, column_type in ALERT_SCHEMA])
+
+
+def _record_batches(alerts: Iterable[AlertRecord], chunk_size: int, schema):
+    import pyarrow as pa
+
+    for chunk in _chunks(alerts, chunk_size):
+        yield pa.RecordBatch.from_pylist(chunk, schema=schema)
+
+
+def write_parquet(alerts: Iterable[AlertRecord], path: Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """Stream alerts to a Parquet file, one row group per chunk"""
+    import pyarrow.parquet as pq
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    schema = _arrow_schema()
+    count = 0
+
+    with pq.ParquetWriter(str(path), schema, compression='zstd') as writer:
+        for batch in _record_batches(alerts, chunk_size, schema):
+            writer.write_batch(batch)
+            count += batch.num_rows
+
+    return count
+
+
+def write_arrow(alerts: Iterable[AlertRecord], path: Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """
+    Stream alerts to an Arrow IPC (Feather v2) file
+
+    The file is uncompressed so it can be memory-mapped and loaded
+    without copying or parsing.
+    """
+    import pyarrow as pa
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    schema = _arrow_schema()
+    count = 0
+
+    with pa.OSFile(str(path), 'wb') as sink, pa.ipc.new_file(sink, schema) as writer:
+        for batch in _record_batches(alerts, chunk_size, schema):
+            writer.write_batch(batch)
+            count += batch.num_rows
+
+    return count
+
+
+def read_alerts(path: Path):
+    """
+    Load exported alerts into a pandas DataFrame
+
+    Arrow and Parquet files are read through a memory map; NDJSON is
+    parsed line by line. Every format comes back with the ALERT_SCHEMA
+    columns as string, datetime64[us], boolean and float64 dtypes.
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+
+    if suffix in ('.arrow', '.feather', '.ipc'):
+        import pyarrow as pa
+        with pa.memory_map(str(path), 'r') as source:
+            return _apply_schema(pa.ipc.open_file(source).read_all().to_pandas())
+
+    if suffix == '.parquet':
+        import pyarrow.parquet as pq
+        return _apply_schema(pq.read_table(str(path), memory_map=True).to_pandas())
+
+    import pandas as pd
+    if path.stat().st_size == 0:
+        # pandas returns a frame without columns for an empty file
+        return _apply_schema(pd.DataFrame())
+
+    # No dtype or date guessing; _apply_schema casts every column
+    return _apply_schema(pd.read_json(path, lines=True, dtype=False, convert_dates=False))
+
+
+def _apply_schema(df):
+    """Give a loaded frame exactly the ALERT_SCHEMA columns and dtypes, whatever the format"""
+    import pandas as pd
+
+    dtypes = {'string': 'string', 'timestamp': 'datetime64[us]', 'bool': 'boolean', 'float': 'float64'}
+    columns = {}
+    for name, column_type in ALERT_SCHEMA:
+        column = df[name] if name in df else pd.Series([None] * len(df), index=df.index, dtype=object)
+        if column_type == 'timestamp':
+            column = pd.to_datetime(column, format='ISO8601')
+        columns[name] = column.astype(dtypes[column_type])
+    return pd.DataFrame(columns, index=df.index)
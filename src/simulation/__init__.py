@@ -0,0 +1,7 @@
+"""
+Storm rehearsal tools: local NOAA stand-in server and replay feeds
+"""
+
+from .noaa_server import Frame, ReplayFeed, NOAAStandInServer, synthetic_storm
+
+__all__ = ['Frame', 'ReplayFeed', 'NOAAStandInServer', 'synthetic_storm']
@@ -0,0 +1,304 @@
+"""
+Local NOAA stand-in server for storm rehearsals and load tests
+Serves recorded or synthetic SWPC products over simulated time, with
+configurable replay speed-up and injected latency/errors
+"""
+
+import argparse
+import json
+import math
+import random
+import threading
+import time
+from bisect import bisect_right
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+
+WWV_PATH = '/text/wwv.txt'
+KP_PATH = '/products/noaa-planetary-k-index.json'
+
+# Directory names of recorded snapshots, e.g. "20240510T173400"
+RECORDING_TIME_FORMAT = "%Y%m%dT%H%M%S"
+
+
+class Frame:
+    """Content of one product path from a point in simulated time onward"""
+
+    def __init__(self, offset: float, path: str, body: Union[str, bytes], content_type: str = 'text/plain'):
+        self.offset = offset
+        self.path = path
+        self.body = body.encode('utf-8') if isinstance(body, str) else body
+        self.content_type = content_type
+
+
+class ReplayFeed:
+    """Time-ordered frames per product path"""
+
+    def __init__(self, frames: List[Frame]):
+        self._frames: Dict[str, List[Frame]] = {}
+        for frame in sorted(frames, key=lambda frame: frame.offset):
+            self._frames.setdefault(frame.path, []).append(frame)
+        self._offsets = {
+            path: [frame.offset for frame in path_frames]
+            for path, path_frames in self._frames.items()
+        }
+
+    @property
+    def paths(self) -> List[str]:
+        return list(self._frames)
+
+    @property
+    def duration(self) -> float:
+        """Simulated seconds until the last frame"""
+        return max((offsets[-1] for offsets in self._offsets.values()), default=0.0)
+
+    def frames(self, path: str) -> List[Frame]:
+        return self._frames.get(path, [])
+
+    def frame_at(self, path: str, elapsed: float) -> Optional[Frame]:
+        """Latest frame for a path at `elapsed` simulated seconds"""
+        offsets = self._offsets.get(path)
+        if not offsets:
+            return None
+        index = bisect_right(offsets, elapsed) - 1
+        return self._frames[path][index] if index >= 0 else None
+
+    @classmethod
+    def from_directory(cls, directory: Path) -> 'ReplayFeed':
+        """
+        Load a recording
+
+        Each subdirectory is one snapshot named with RECORDING_TIME_FORMAT
+        and mirrors the URL layout (e.g. text/wwv.txt); offsets are relative
+        to the earliest snapshot.
+        """
+        directory = Path(directory)
+        snapshots = []
+        for snapshot_dir in directory.iterdir():
+            if not snapshot_dir.is_dir():
+                continue
+            try:
+                taken_at = datetime.strptime(snapshot_dir.name, RECORDING_TIME_FORMAT)
+            except ValueError:
+                continue
+            snapshots.append((taken_at, snapshot_dir))
+
+        if not snapshots:
+            return cls([])
+
+        start = min(taken_at for taken_at, _ in snapshots)
+        frames = []
+        for taken_at, snapshot_dir in snapshots:
+            offset = (taken_at - start).total_seconds()
+            for file_path in snapshot_dir.rglob('*'):
+                if file_path.is_file():
+                    url_path = '/' + file_path.relative_to(snapshot_dir).as_posix()
+                    content_type = 'application/json' if file_path.suffix == '.json' else 'text/plain'
+                    frames.append(Frame(offset, url_path, file_path.read_bytes(), content_type))
+        return cls(frames)
+
+
+def _kp_label(kp: float) -> str:
+    """NOAA scale label for a Kp value"""
+    names = ['Minor', 'Moderate', 'Strong', 'Severe', 'Extreme']
+    level = min(int(kp) - 4, 5)
+    return f"G{level} - {names[level - 1]}"
+
+
+def synthetic_storm(peak_kp: float = 9.0,
+                    duration_hours: float = 24.0,
+                    step_minutes: float = 15.0,
+                    start: Optional[datetime] = None,
+                    first_serial: int = 1000) -> ReplayFeed:
+    """
+    Build a synthetic storm: Kp rises to `peak_kp` and decays again
+
+    A K-index alert is issued every 3-hour synoptic period with Kp >= 5
+    (G1+). Messages use the layout parse_alert_message/parse_geomagnetic_alert
+    understand; the Kp JSON product follows the SWPC row format.
+    """
+    start = start or datetime.utcnow().replace(minute=0, second=0, microsecond=0)
+    steps = int(duration_hours * 60 / step_minutes) + 1
+
+    frames = []
+    messages: List[str] = []
+    kp_rows = [["time_tag", "Kp", "a_running", "station_count"]]
+    serial = first_serial
+    last_period = None
+
+    for step in range(steps):
+        offset = step * step_minutes * 60
+        now = start + timedelta(seconds=offset)
+        phase = min(offset / (duration_hours * 3600), 1.0)
+        kp = round(2.0 + (peak_kp - 2.0) * math.sin(math.pi * phase) ** 2, 2)
+
+        period = int(offset // (3 * 3600))
+        if period != last_period:
+            last_period = period
+            kp_rows.append([now.strftime("%Y-%m-%d %H:%M:%S.000"), f"{kp:.2f}", str(int(kp * 8)), "8"])
+
+            if kp >= 5:
+                serial += 1
+                k_index = min(int(kp), 9)
+                boundary = max(85 - 5 * k_index, 40)
+                messages.insert(0, "\n".join([
+                    f"KA {serial:04d}",
+                    f"Issue Time: {now.strftime('%Y %b %d %H%M')} UTC",
+                    f"ALERT: Geomagnetic K-index of {k_index}",
+                    f"Valid From: {now.strftime('%Y %b %d %H%M')} UTC",
+                    f"Valid To: {(now + timedelta(hours=3)).strftime('%Y %b %d %H%M')} UTC",
+                    f"NOAA Scale: {_kp_label(kp)}",
+                    f"Potential Impacts: Area of impact primarily poleward of {boundary} degrees "
+                    f"Geomagnetic Latitude.",
+                ]))
+
+        frames.append(Frame(offset, WWV_PATH, "\n\n".join(messages) + "\n"))
+        frames.append(Frame(offset, KP_PATH, json.dumps(kp_rows), 'application/json'))
+
+    return ReplayFeed(frames)
+
+
+class NOAAStandInServer:
+    """
+    HTTP server replaying a feed in accelerated simulated time
+
+    Point NOAADataFetcher at `base_url` (or set SWPC_BASE_URL). Every
+    request waits `latency` (+ up to `latency_jitter`) seconds and fails
+    with `error_status` with probability `error_rate`.
+    """
+
+    def __init__(self,
+                 feed: ReplayFeed,
+                 speedup: float = 1.0,
+                 latency: float = 0.0,
+                 latency_jitter: float = 0.0,
+                 error_rate: float = 0.0,
+                 error_status: int = 503,
+                 host: str = '127.0.0.1',
+                 port: int = 0):
+        if not 1.0 <= speedup <= 1000.0:
+            raise ValueError("speedup must be between 1 and 1000")
+
+        self.feed = feed
+        self.speedup = speedup
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.requests = 0
+        self.errors = 0
+        self.started_at: Optional[float] = None
+
+        self._stats_lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def elapsed(self) -> float:
+        """Simulated seconds since start()"""
+        if self.started_at is None:
+            return 0.0
+        return (time.monotonic() - self.started_at) * self.speedup
+
+    def wall_time_of(self, offset: float) -> float:
+        """time.monotonic() value at which a simulated offset is reached"""
+        return self.started_at + offset / self.speedup
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server._handle(self)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def _handle(self, handler: BaseHTTPRequestHandler):
+        with self._stats_lock:
+            self.requests += 1
+
+        delay = self.latency + random.uniform(0, self.latency_jitter)
+        if delay > 0:
+            time.sleep(delay)
+
+        if self.error_rate and random.random() < self.error_rate:
+            with self._stats_lock:
+                self.errors += 1
+            handler.send_error(self.error_status)
+            return
+
+        frame = self.feed.frame_at(handler.path.split('?', 1)[0], self.elapsed())
+        if frame is None:
+            handler.send_error(404)
+            return
+
+        handler.send_response(200)
+        handler.send_header('Content-Type', frame.content_type)
+        handler.send_header('Content-Length', str(len(frame.body)))
+        handler.end_headers()
+        handler.wfile.write(frame.body)
+
+    def start(self) -> 'NOAAStandInServer':
+        """Start serving in a background thread; simulated time starts now"""
+        self.started_at = time.monotonic()
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop the server"""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    """Run the stand-in server from the command line"""
+    parser = argparse.ArgumentParser(description="Local NOAA SWPC stand-in server")
+    parser.add_argument('--recording', type=Path, help="Recording directory (default: synthetic storm)")
+    parser.add_argument('--peak-kp', type=float, default=9.0)
+    parser.add_argument('--duration-hours', type=float, default=24.0)
+    parser.add_argument('--speedup', type=float, default=1.0)
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    args = parser.parse_args()
+
+    if args.recording:
+        feed = ReplayFeed.from_directory(args.recording)
+    else:
+        feed = synthetic_storm(args.peak_kp, args.duration_hours)
+
+    server = NOAAStandInServer(feed, speedup=args.speedup, latency=args.latency,
+                               error_rate=args.error_rate, host=args.host, port=args.port)
+    server.start()
+    print(f"Serving {len(feed.paths)} products at {server.base_url} ({args.speedup}x)")
+    print(f"Set SWPC_BASE_URL={server.base_url} to use it")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
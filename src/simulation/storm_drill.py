@@ -0,0 +1,135 @@
+"""
+Storm drill: end-to-end latency and throughput under a simulated storm
+Runs ingestion, translation and notification formatting against the
+local stand-in server
+"""
+
+import argparse
+import re
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .noaa_server import NOAAStandInServer, WWV_PATH, synthetic_storm
+from ..data_ingestion.noaa_api import NOAADataFetcher
+from ..data_ingestion.resilience import CircuitBreaker
+from ..alerts.alert_processor import AlertProcessor
+from ..translation.translator import AlertTranslator
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * pct / 100), len(ordered) - 1)]
+
+
+def _publish_offsets(server: NOAAStandInServer) -> Dict[str, float]:
+    """Simulated offset at which each serial number first appears"""
+    offsets = {}
+    for frame in server.feed.frames(WWV_PATH):
+        for serial in re.findall(r'^[A-Z]{1,3}\s+(\d{4})', frame.body.decode('utf-8'), re.MULTILINE):
+            offsets.setdefault(serial, frame.offset)
+    return offsets
+
+
+def run_storm_drill(speedup: float = 100.0,
+                    peak_kp: float = 9.0,
+                    duration_hours: float = 24.0,
+                    poll_interval: float = 0.5,
+                    latency: float = 0.0,
+                    error_rate: float = 0.0,
+                    languages: Optional[List[str]] = None) -> Dict:
+    """
+    Replay a synthetic storm and measure the pipeline
+
+    Alert latency is the wall time from a bulletin appearing on the
+    stand-in server to its notification being ready.
+    """
+    feed = synthetic_storm(peak_kp, duration_hours)
+    server = NOAAStandInServer(feed, speedup=speedup, latency=latency, error_rate=error_rate)
+    processor = AlertProcessor()
+    translators = [AlertTranslator(target_lang=lang, offline=True) for lang in (languages or ['ru'])]
+
+    fetch_times = []
+    alert_latencies = []
+    processing_times = []
+    seen = set()
+    polls = 0
+
+    with tempfile.TemporaryDirectory() as tmp_dir, server:
+        publish_offsets = _publish_offsets(server)
+        # Breaker timeouts run in simulated time like everything else
+        breaker = CircuitBreaker(reset_timeout=60.0 / speedup)
+        fetcher = NOAADataFetcher(base_url=server.base_url,
+                                  snapshot_path=Path(tmp_dir) / 'wwv_snapshot.txt',
+                                  breaker=breaker)
+
+        while server.elapsed() <= feed.duration:
+            polls += 1
+            started = time.monotonic()
+            alerts = fetcher.get_alerts()
+            fetch_times.append(time.monotonic() - started)
+
+            for alert in alerts:
+                if alert.serial_number in seen:
+                    continue
+                seen.add(alert.serial_number)
+
+                process_started = time.monotonic()
+                alert_dict = processor.process_alerts([alert], translate=False)[0]
+                for translator in translators:
+                    translator.translate_alert(alert_dict)
+                processor.format_for_notification(alert)
+                done = time.monotonic()
+
+                processing_times.append(done - process_started)
+                if alert.serial_number in publish_offsets:
+                    published = server.wall_time_of(publish_offsets[alert.serial_number])
+                    alert_latencies.append(max(done - published, 0.0))
+
+            time.sleep(poll_interval)
+
+        requests_served = server.requests
+        errors_injected = server.errors
+
+    total_processing = sum(processing_times)
+    return {
+        'polls': polls,
+        'requests': requests_served,
+        'errors_injected': errors_injected,
+        'alerts': len(seen),
+        'fetch_p50_ms': _percentile(fetch_times, 50) * 1000,
+        'fetch_p95_ms': _percentile(fetch_times, 95) * 1000,
+        'alert_latency_p50_s': _percentile(alert_latencies, 50),
+        'alert_latency_p95_s': _percentile(alert_latencies, 95),
+        'alert_latency_max_s': max(alert_latencies, default=0.0),
+        'alerts_per_second': len(processing_times) / total_processing if total_processing else 0.0,
+    }
+
+
+def main():
+    """Run a storm drill from the command line"""
+    parser = argparse.ArgumentParser(description="Simulated storm drill")
+    parser.add_argument('--speedup', type=float, default=100.0)
+    parser.add_argument('--peak-kp', type=float, default=9.0)
+    parser.add_argument('--duration-hours', type=float, default=24.0)
+    parser.add_argument('--poll-interval', type=float, default=0.5)
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--languages', nargs='*', default=['ru'])
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print(f"Storm drill: peak Kp {args.peak_kp}, {args.duration_hours} h at {args.speedup}x")
+    print("=" * 60)
+
+    results = run_storm_drill(args.speedup, args.peak_kp, args.duration_hours, args.poll_interval,
+                              args.latency, args.error_rate, args.languages)
+    for name, value in results.items():
+        print(f"  {name}: {value:.3f}" if isinstance(value, float) else f"  {name}: {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,14 @@ Translation module for space weather alerts
 Supports English and Russian
 """
 
-from .translator import AlertTranslator, translate_text, translate_alert_data
-
-__all__ = ['AlertTranslator', 'translate_text', 'translate_alert_data']
+from .translator import (
+    AlertTranslator, MultiLanguageTranslator, get_translator,
+    translate_text, translate_alert_data, translate_alerts_multi
+)
+from .templates import TemplateLocalizer
 
+__all__ = [
+    'AlertTranslator', 'MultiLanguageTranslator', 'get_translator',
+    'translate_text', 'translate_alert_data', 'translate_alerts_multi',
+    'TemplateLocalizer'
+]
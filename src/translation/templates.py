@@ -0,0 +1,497 @@
+"""
+Offline template-based localization for SWPC messages
+SWPC bulletins are built from fixed lines per message code, so known
+lines are matched against templates and filled in locally
+"""
+
+import re
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+# Typed slots: regex for matching and how the value is rendered per language
+SLOT_PATTERNS = {
+    'int': r'\d+',
+    'number': r'[-+]?\d+(?:\.\d+)?',
+    'time': r'\d{4}\s+\w{3}\s+\d{1,2}\s+\d{4}\s+UTC',
+    'hours': r'\d{4}-\d{4}\s+UTC',
+    'scale': r'[GRS][1-5]',
+    'code': r'[A-Za-z0-9.+-]+',
+}
+
+# Localized timestamp formats
+TIME_FORMATS = {
+    'ru': "%d.%m.%Y %H:%M UTC",
+}
+
+# Shared by every message code
+COMMON_TEMPLATES = [
+    ("{code:code} {serial:int}", {'ru': "{code} {serial}"}),
+    ("Space Weather Message Code: {code:code}", {'ru': "Код сообщения космической погоды: {code}"}),
+    ("Serial Number: {serial:int}", {'ru': "Серийный номер: {serial}"}),
+    ("Issue Time: {time:time}", {'ru': "Время выпуска: {time}"}),
+    ("Begin Time: {time:time}", {'ru': "Время начала: {time}"}),
+    ("Maximum Time: {time:time}", {'ru': "Время максимума: {time}"}),
+    ("End Time: {time:time}", {'ru': "Время окончания: {time}"}),
+    ("Valid From: {time:time}", {'ru': "Действует с: {time}"}),
+    ("Valid To: {time:time}", {'ru': "Действует до: {time}"}),
+    ("Now Valid Until: {time:time}", {'ru': "Теперь действует до: {time}"}),
+    ("Threshold Reached: {time:time}", {'ru': "Порог достигнут: {time}"}),
+    ("Synoptic Period: {period:hours}", {'ru': "Синоптический период: {period}"}),
+    ("Active Warning: Yes", {'ru': "Активное предупреждение: Да"}),
+    ("Active Warning: No", {'ru': "Активное предупреждение: Нет"}),
+    ("Warning Condition: Onset", {'ru': "Условие предупреждения: Начало"}),
+    ("Warning Condition: Persistence", {'ru': "Условие предупреждения: Продолжение"}),
+    ("Extension to Serial Number: {serial:int}", {'ru': "Продление к серийному номеру: {serial}"}),
+    ("Cancel Serial Number: {serial:int}", {'ru': "Отмена серийного номера: {serial}"}),
+    ("NOAA Scale: {scale:scale} - Minor", {'ru': "Шкала NOAA: {scale} - Слабая"}),
+    ("NOAA Scale: {scale:scale} - Moderate", {'ru': "Шкала NOAA: {scale} - Умеренная"}),
+    ("NOAA Scale: {scale:scale} - Strong", {'ru': "Шкала NOAA: {scale} - Сильная"}),
+    ("NOAA Scale: {scale:scale} - Severe", {'ru': "Шкала NOAA: {scale} - Очень сильная"}),
+    ("NOAA Scale: {scale:scale} - Extreme", {'ru': "Шкала NOAA: {scale} - Экстремальная"}),
+    ("NOAA Scale: {scale:scale}", {'ru': "Шкала NOAA: {scale}"}),
+    ("Potential Impacts: Area of impact primarily poleward of {lat:int} degrees Geomagnetic Latitude.",
+     {'ru': "Возможные последствия: Зона воздействия в основном выше {lat} градусов геомагнитной широты."}),
+]
+
+# Fixed boilerplate SWPC appends to alerts: the scale reference and the
+# per-level impact lines of the NOAA G (geomagnetic), S (radiation) and
+# R (radio blackout) scales
+BOILERPLATE_TEMPLATES = [
+    ("NOAA Space Weather Scale descriptions can be found at",
+     {'ru': "Описание шкал космической погоды NOAA доступно по адресу"}),
+    ("www.swpc.noaa.gov/noaa-scales-explanation", {'ru': "www.swpc.noaa.gov/noaa-scales-explanation"}),
+
+    # G1 (K5)
+    ("Induced Currents - Weak power grid fluctuations can occur.",
+     {'ru': "Индуцированные токи - Возможны слабые колебания в энергосетях."}),
+    ("Spacecraft - Minor impact on satellite operations possible.",
+     {'ru': "Космические аппараты - Возможно незначительное влияние на работу спутников."}),
+    ("Aurora - Aurora may be visible at high latitudes, i.e., northern tier of the U.S. "
+     "such as northern Michigan and Maine.",
+     {'ru': "Полярные сияния - Полярные сияния могут наблюдаться в высоких широтах, "
+            "например на севере США (север Мичигана и Мэн)."}),
+    # G2 (K6)
+    ("Induced Currents - Power grid fluctuations can occur. High-latitude power systems "
+     "may experience voltage alarms.",
+     {'ru': "Индуцированные токи - Возможны колебания в энергосетях. В высокоширотных "
+            "энергосистемах возможны срабатывания сигнализации по напряжению."}),
+    ("Spacecraft - Satellite orientation irregularities may occur; increased drag on low "
+     "Earth-orbit satellites is possible.",
+     {'ru': "Космические аппараты - Возможны нарушения ориентации спутников; возможно "
+            "усиление торможения спутников на низкой околоземной орбите."}),
+    ("Radio - HF (high frequency) radio propagation can fade at higher latitudes.",
+     {'ru': "Радиосвязь - В высоких широтах возможны замирания КВ-радиосвязи."}),
+    ("Aurora - Aurora may be seen as low as New York to Wisconsin to Washington state.",
+     {'ru': "Полярные сияния - Полярные сияния могут наблюдаться до широт Нью-Йорка, "
+            "Висконсина и штата Вашингтон."}),
+    # G3 (K7)
+    ("Induced Currents - Power system voltage irregularities are possible; false alarms "
+     "may be triggered on some protection devices.",
+     {'ru': "Индуцированные токи - Возможны нарушения напряжения в энергосистемах; "
+            "некоторые защитные устройства могут срабатывать ложно."}),
+    ("Spacecraft - Systems may experience surface charging; increased drag on low "
+     "Earth-orbit satellites and orientation problems may occur.",
+     {'ru': "Космические аппараты - Возможна поверхностная электризация; возможны усиление "
+            "торможения спутников на низкой околоземной орбите и проблемы с ориентацией."}),
+    ("Navigation - Intermittent satellite navigation (GPS) problems, including "
+     "loss-of-lock and increased range error, may occur.",
+     {'ru': "Навигация - Возможны перебои спутниковой навигации (GPS), включая потерю "
+            "захвата сигнала и рост ошибки определения дальности."}),
+    ("Radio - HF (high frequency) radio may be intermittent.",
+     {'ru': "Радиосвязь - КВ-радиосвязь может быть неустойчивой."}),
+    ("Aurora - Aurora may be seen as low as Pennsylvania to Iowa to Oregon.",
+     {'ru': "Полярные сияния - Полярные сияния могут наблюдаться до широт Пенсильвании, "
+            "Айовы и Орегона."}),
+    # G4 (K8, K9-)
+    ("Induced Currents - Possible widespread voltage control problems and some protective "
+     "systems will mistakenly trip out key assets from the power grid. "
+     "Induced pipeline currents intensify.",
+     {'ru': "Индуцированные токи - Возможны масштабные проблемы с регулированием напряжения, "
+            "некоторые защитные системы ошибочно отключат ключевые элементы энергосети. "
+            "Индуцированные токи в трубопроводах усиливаются."}),
+    ("Spacecraft - Systems may experience surface charging and tracking problems, and "
+     "orientation problems may need correction.",
+     {'ru': "Космические аппараты - Возможны поверхностная электризация и проблемы "
+            "с сопровождением; проблемы с ориентацией могут потребовать коррекции."}),
+    ("Navigation - Satellite navigation (GPS) degraded or inoperable for hours.",
+     {'ru': "Навигация - Спутниковая навигация (GPS) ухудшена или недоступна в течение нескольких часов."}),
+    ("Radio - HF (high frequency) radio propagation sporadic or blacked out.",
+     {'ru': "Радиосвязь - КВ-радиосвязь нерегулярна или полностью прервана."}),
+    ("Aurora - Aurora may be seen as low as Alabama and northern California.",
+     {'ru': "Полярные сияния - Полярные сияния могут наблюдаться до широт Алабамы и северной Калифорнии."}),
+    # G5 (K9)
+    ("Induced Currents - Widespread voltage control problems and protective system problems "
+     "can occur; some grid systems may experience complete collapse or blackouts. "
+     "Transformers may experience damage.",
+     {'ru': "Индуцированные токи - Возможны масштабные проблемы с регулированием напряжения "
+            "и защитными системами; некоторые энергосистемы могут полностью отключиться. "
+            "Возможны повреждения трансформаторов."}),
+    ("Spacecraft - Extensive surface charging, problems with orientation, uplink/downlink "
+     "and tracking satellites.",
+     {'ru': "Космические аппараты - Сильная поверхностная электризация, проблемы с ориентацией, "
+            "связью и сопровождением спутников."}),
+    ("Navigation - Satellite navigation (GPS) may be degraded for days.",
+     {'ru': "Навигация - Спутниковая навигация (GPS) может быть ухудшена в течение нескольких дней."}),
+    ("Radio - HF (high frequency) radio propagation may be impossible in many areas for "
+     "one to two days.",
+     {'ru': "Радиосвязь - КВ-радиосвязь может быть невозможна во многих районах в течение одного-двух дней."}),
+    ("Aurora - Aurora may be seen as low as Florida and southern Texas.",
+     {'ru': "Полярные сияния - Полярные сияния могут наблюдаться до широт Флориды и юга Техаса."}),
+
+    # S1-S5 (proton events)
+    ("Radio - Minor impacts on HF (high frequency) radio in the polar regions.",
+     {'ru': "Радиосвязь - Незначительное влияние на КВ-радиосвязь в полярных регионах."}),
+    ("Radiation - Passengers and crew in high-flying aircraft at high latitudes may be "
+     "exposed to elevated radiation risk.",
+     {'ru': "Радиация - Пассажиры и экипажи высотных рейсов в высоких широтах могут "
+            "подвергаться повышенному радиационному риску."}),
+    ("Spacecraft - Infrequent single-event upsets possible.",
+     {'ru': "Космические аппараты - Возможны редкие одиночные сбои."}),
+    ("Radio - Small effects on HF (high frequency) propagation through the polar regions "
+     "and navigation at polar cap locations possibly affected.",
+     {'ru': "Радиосвязь - Небольшое влияние на КВ-радиосвязь через полярные регионы; "
+            "возможны помехи навигации в районе полярных шапок."}),
+    ("Radiation - Radiation hazard avoidance recommended for astronauts on EVA; passengers "
+     "and crew in high-flying aircraft at high latitudes may be exposed to radiation risk.",
+     {'ru': "Радиация - Астронавтам при выходе в открытый космос рекомендуется избегать "
+            "радиационной опасности; пассажиры и экипажи высотных рейсов в высоких широтах "
+            "могут подвергаться радиационному риску."}),
+    ("Spacecraft - Single-event upsets, noise in imaging systems, and slight reduction of "
+     "efficiency in solar panel are likely.",
+     {'ru': "Космические аппараты - Вероятны одиночные сбои, шумы в системах формирования "
+            "изображений и небольшое снижение эффективности солнечных панелей."}),
+    ("Radio - Degraded HF (high frequency) radio propagation through the polar regions and "
+     "navigation position errors likely.",
+     {'ru': "Радиосвязь - Вероятны ухудшение КВ-радиосвязи через полярные регионы "
+            "и ошибки навигационного позиционирования."}),
+    ("Radiation - Unavoidable radiation hazard to astronauts on EVA; passengers and crew "
+     "in high-flying aircraft at high latitudes may be exposed to radiation risk.",
+     {'ru': "Радиация - Неизбежная радиационная опасность для астронавтов в открытом космосе; "
+            "пассажиры и экипажи высотных рейсов в высоких широтах могут подвергаться "
+            "радиационному риску."}),
+    ("Spacecraft - May experience memory device problems and noise on imaging systems; "
+     "star-tracker problems may cause orientation problems, and solar panel efficiency "
+     "can be degraded.",
+     {'ru': "Космические аппараты - Возможны сбои устройств памяти и шумы в системах "
+            "формирования изображений; сбои звёздных датчиков могут нарушить ориентацию, "
+            "эффективность солнечных панелей может снизиться."}),
+    ("Radio - Blackout of HF (high frequency) radio communications through the polar "
+     "regions and increased navigation errors over several days are likely.",
+     {'ru': "Радиосвязь - Вероятны прекращение КВ-радиосвязи через полярные регионы "
+            "и рост навигационных ошибок в течение нескольких дней."}),
+    ("Radiation - Unavoidable high radiation hazard to astronauts on EVA; passengers and "
+     "crew in high-flying aircraft at high latitudes may be exposed to radiation risk.",
+     {'ru': "Радиация - Неизбежная высокая радиационная опасность для астронавтов в открытом "
+            "космосе; пассажиры и экипажи высотных рейсов в высоких широтах могут "
+            "подвергаться радиационному риску."}),
+    ("Spacecraft - Satellites may be rendered useless, memory impacts can cause loss of "
+     "control, may cause serious noise in image data, star-trackers may be unable to "
+     "locate sources; permanent damage to solar panels possible.",
+     {'ru': "Космические аппараты - Спутники могут выйти из строя, сбои памяти могут привести "
+            "к потере управления, возможны сильные шумы в изображениях, звёздные датчики "
+            "могут не находить ориентиры; возможно необратимое повреждение солнечных панелей."}),
+    ("Radio - Complete blackout of HF (high frequency) communications possible through the "
+     "polar regions, and position errors make navigation operations extremely difficult.",
+     {'ru': "Радиосвязь - Возможно полное прекращение КВ-связи через полярные регионы; "
+            "ошибки позиционирования крайне затрудняют навигацию."}),
+
+    # R1-R5 (radio blackouts)
+    ("Radio - Weak or minor degradation of HF (high frequency) radio communication on "
+     "sunlit side, occasional loss of radio contact.",
+     {'ru': "Радиосвязь - Слабое ухудшение КВ-радиосвязи на дневной стороне, "
+            "эпизодическая потеря радиосвязи."}),
+    ("Navigation - Low-frequency navigation signals degraded for brief intervals.",
+     {'ru': "Навигация - Кратковременное ухудшение низкочастотных навигационных сигналов."}),
+    ("Radio - Limited blackout of HF (high frequency) radio communication on sunlit side, "
+     "loss of radio contact for tens of minutes.",
+     {'ru': "Радиосвязь - Ограниченное прекращение КВ-радиосвязи на дневной стороне, "
+            "потеря радиосвязи на десятки минут."}),
+    ("Navigation - Degradation of low-frequency navigation signals for tens of minutes.",
+     {'ru': "Навигация - Ухудшение низкочастотных навигационных сигналов на десятки минут."}),
+    ("Radio - Wide area blackout of HF (high frequency) radio communication, loss of radio "
+     "contact for about an hour on sunlit side of Earth.",
+     {'ru': "Радиосвязь - Прекращение КВ-радиосвязи на обширной территории, потеря радиосвязи "
+            "примерно на час на дневной стороне Земли."}),
+    ("Navigation - Low-frequency navigation signals degraded for about an hour.",
+     {'ru': "Навигация - Ухудшение низкочастотных навигационных сигналов примерно на час."}),
+    ("Radio - HF (high frequency) radio communication blackout on most of the sunlit side "
+     "of Earth for one to two hours.",
+     {'ru': "Радиосвязь - Прекращение КВ-радиосвязи на большей части дневной стороны Земли "
+            "на один-два часа."}),
+    ("Navigation - Outages of low-frequency navigation signals cause increased error in "
+     "positioning for one to two hours.",
+     {'ru': "Навигация - Сбои низкочастотных навигационных сигналов увеличивают ошибку "
+            "позиционирования в течение одного-двух часов."}),
+    ("Radio - Complete HF (high frequency) radio blackout on the entire sunlit side of the "
+     "Earth lasting for a number of hours.",
+     {'ru': "Радиосвязь - Полное прекращение КВ-радиосвязи на всей дневной стороне Земли "
+            "в течение нескольких часов."}),
+    ("Navigation - Low-frequency navigation signals used by maritime and general aviation "
+     "systems experience outages on the sunlit side of the Earth for many hours.",
+     {'ru': "Навигация - Низкочастотные навигационные сигналы морских систем и авиации общего "
+            "назначения недоступны на дневной стороне Земли в течение многих часов."}),
+]
+
+# Message-code specific lines, keyed by message code prefix
+CODE_TEMPLATES = {
+    # Geomagnetic K-index alerts/warnings
+    'ALTK': [
+        ("ALERT: Geomagnetic K-index of {k:int}", {'ru': "ОПОВЕЩЕНИЕ: Геомагнитный K-индекс {k}"}),
+    ],
+    'WARK': [
+        ("WARNING: Geomagnetic K-index of {k:int} expected",
+         {'ru': "ПРЕДУПРЕЖДЕНИЕ: Ожидается геомагнитный K-индекс {k}"}),
+        ("WARNING: Geomagnetic K-index of {k:int} or greater expected",
+         {'ru': "ПРЕДУПРЕЖДЕНИЕ: Ожидается геомагнитный K-индекс {k} или выше"}),
+        ("EXTENDED WARNING: Geomagnetic K-index of {k:int} expected",
+         {'ru': "ПРОДЛЁННОЕ ПРЕДУПРЕЖДЕНИЕ: Ожидается геомагнитный K-индекс {k}"}),
+        ("EXTENDED WARNING: Geomagnetic K-index of {k:int} or greater expected",
+         {'ru': "ПРОДЛЁННОЕ ПРЕДУПРЕЖДЕНИЕ: Ожидается геомагнитный K-индекс {k} или выше"}),
+        ("CANCEL WARNING: Geomagnetic K-index of {k:int} expected",
+         {'ru': "ОТМЕНА ПРЕДУПРЕЖДЕНИЯ: Ожидался геомагнитный K-индекс {k}"}),
+    ],
+    # Geomagnetic storm watches
+    'WATA': [
+        ("WATCH: Geomagnetic Storm Category {scale:scale} Predicted",
+         {'ru': "ПРОГНОЗ: Ожидается геомагнитная буря категории {scale}"}),
+        ("Highest Storm Level Predicted by Day:",
+         {'ru': "Наивысший прогнозируемый уровень бури по дням:"}),
+    ],
+    # Sudden impulse
+    'SUMSUD': [
+        ("SUMMARY: Geomagnetic Sudden Impulse", {'ru': "СВОДКА: Геомагнитный внезапный импульс"}),
+        ("Observed: {time:time}", {'ru': "Наблюдался: {time}"}),
+        ("Deviation: {nt:int} nT", {'ru': "Отклонение: {nt} нТл"}),
+    ],
+    'WARSUD': [
+        ("WARNING: Geomagnetic Sudden Impulse expected",
+         {'ru': "ПРЕДУПРЕЖДЕНИЕ: Ожидается геомагнитный внезапный импульс"}),
+        ("IP Shock Passage Observed: {time:time}", {'ru': "Прохождение межпланетной ударной волны: {time}"}),
+    ],
+    # X-ray events
+    'SUMX': [
+        ("SUMMARY: X-ray Event exceeded {cls:code}", {'ru': "СВОДКА: Рентгеновское событие превысило {cls}"}),
+        ("X-ray Class: {cls:code}", {'ru': "Рентгеновский класс: {cls}"}),
+        ("Optical Class: {cls:code}", {'ru': "Оптический класс: {cls}"}),
+        ("Location: {loc:code}", {'ru': "Расположение: {loc}"}),
+    ],
+    'ALTXMF': [
+        ("ALERT: X-Ray Flux exceeded {cls:code}", {'ru': "ОПОВЕЩЕНИЕ: Поток рентгеновского излучения превысил {cls}"}),
+    ],
+    # Radio emissions
+    'ALTTP': [
+        ("ALERT: Type II Radio Emission", {'ru': "ОПОВЕЩЕНИЕ: Радиовсплеск II типа"}),
+        ("ALERT: Type IV Radio Emission", {'ru': "ОПОВЕЩЕНИЕ: Радиовсплеск IV типа"}),
+        ("Estimated Velocity: {v:int} km/s", {'ru': "Расчётная скорость: {v} км/с"}),
+    ],
+    'SUM10R': [
+        ("SUMMARY: 10cm Radio Burst", {'ru': "СВОДКА: Радиовсплеск на 10 см"}),
+        ("Peak Flux: {flux:int} sfu", {'ru': "Пиковый поток: {flux} с.е.п."}),
+        ("Duration: {minutes:int} minutes", {'ru': "Длительность: {minutes} минут"}),
+    ],
+    # Particle flux
+    'ALTEF': [
+        ("ALERT: Electron 2MeV Integral Flux exceeded {pfu:int}pfu",
+         {'ru': "ОПОВЕЩЕНИЕ: Интегральный поток электронов 2 МэВ превысил {pfu} pfu"}),
+        ("CONTINUED ALERT: Electron 2MeV Integral Flux exceeded {pfu:int}pfu",
+         {'ru': "ПРОДОЛЖЕНИЕ ОПОВЕЩЕНИЯ: Интегральный поток электронов 2 МэВ превысил {pfu} pfu"}),
+        ("Continuation of Serial Number: {serial:int}", {'ru': "Продолжение серийного номера: {serial}"}),
+        ("Yesterday Maximum 2MeV Flux: {pfu:int} pfu", {'ru': "Максимальный поток 2 МэВ за вчера: {pfu} pfu"}),
+    ],
+    'ALTPX': [
+        ("ALERT: Proton Event {mev:int}MeV Integral Flux exceeded {pfu:int}pfu",
+         {'ru': "ОПОВЕЩЕНИЕ: Протонное событие, интегральный поток {mev} МэВ превысил {pfu} pfu"}),
+    ],
+    'WARPX': [
+        ("WARNING: Proton {mev:int}MeV Integral Flux above {pfu:int}pfu expected",
+         {'ru': "ПРЕДУПРЕЖДЕНИЕ: Ожидается интегральный поток протонов {mev} МэВ выше {pfu} pfu"}),
+    ],
+}
+
+# Label in front of a headline, e.g. "ALERT: " or "EXTENDED WARNING: "
+_LABEL_RE = re.compile(r'^[A-Z][A-Z ]*: ')
+
+
+def _headline_values(code_templates: Dict[str, List[Tuple[str, Dict[str, str]]]]) -> List[Tuple[str, Dict[str, str]]]:
+    """Headline templates without their label, as stored in warning_type"""
+    values = {}
+    for templates in code_templates.values():
+        for pattern, localized in templates:
+            label = _LABEL_RE.match(pattern)
+            if label and pattern[label.end():] not in values:
+                values[pattern[label.end():]] = {
+                    lang: text.split(': ', 1)[-1] for lang, text in localized.items()
+                }
+    return list(values.items())
+
+
+# Bare values of parsed alert fields, keyed by field name
+FIELD_TEMPLATES = {
+    'warning_type': _headline_values(CODE_TEMPLATES),
+    'warning_condition': [
+        ("Onset", {'ru': "Начало"}),
+        ("Persistence", {'ru': "Продолжение"}),
+    ],
+    'noaa_scale': [
+        ("{scale:scale} - Minor", {'ru': "{scale} - Слабая"}),
+        ("{scale:scale} - Moderate", {'ru': "{scale} - Умеренная"}),
+        ("{scale:scale} - Strong", {'ru': "{scale} - Сильная"}),
+        ("{scale:scale} - Severe", {'ru': "{scale} - Очень сильная"}),
+        ("{scale:scale} - Extreme", {'ru': "{scale} - Экстремальная"}),
+        ("{scale:scale}", {'ru': "{scale}"}),
+    ],
+    'potential_impacts': [
+        ("Area of impact primarily poleward of {lat:int} degrees Geomagnetic Latitude.",
+         {'ru': "Зона воздействия в основном выше {lat} градусов геомагнитной широты."}),
+    ],
+}
+
+_SLOT_RE = re.compile(r'\{(\w+):(\w+)\}')
+
+
+class LineTemplate:
+    """A single English line template with typed slots"""
+
+    def __init__(self, pattern: str, localized: Dict[str, str]):
+        self.pattern = pattern
+        self.localized = localized
+        self.slots: Dict[str, str] = {}
+
+        parts = []
+        last = 0
+        for match in _SLOT_RE.finditer(pattern):
+            name, slot_type = match.group(1), match.group(2)
+            self.slots[name] = slot_type
+            parts.append(re.escape(pattern[last:match.start()]))
+            parts.append(f"(?P<{name}>{SLOT_PATTERNS[slot_type]})")
+            last = match.end()
+        parts.append(re.escape(pattern[last:]))
+        self.regex = re.compile(''.join(parts) + r'\Z')
+
+        # Literal text before the first slot, used to index templates
+        first_slot = _SLOT_RE.search(pattern)
+        self.prefix = pattern[:first_slot.start()] if first_slot else pattern
+
+    def render(self, match: 're.Match', lang: str) -> str:
+        """Fill the localized template with the matched slot values"""
+        values = {
+            name: format_slot(match.group(name), slot_type, lang)
+            for name, slot_type in self.slots.items()
+        }
+        return self.localized[lang].format(**values)
+
+
+def format_slot(value: str, slot_type: str, lang: str) -> str:
+    """Render a slot value for the target language"""
+    if slot_type == 'time' and lang in TIME_FORMATS:
+        try:
+            parsed = datetime.strptime(' '.join(value.split()), "%Y %b %d %H%M UTC")
+            return parsed.strftime(TIME_FORMATS[lang])
+        except ValueError:
+            return value
+    return value
+
+
+class TemplateLocalizer:
+    """
+    Localizes SWPC messages line by line using known templates
+
+    Lines that match a template are rendered locally; anything else is
+    passed to the optional `fallback` (e.g. machine translation) or left
+    unchanged when there is none, so the localizer works fully offline.
+    """
+
+    def __init__(self, target_lang: str = 'ru'):
+        self.target_lang = target_lang
+        self.hits = 0
+        self.misses = 0
+
+        self._common = self._index(COMMON_TEMPLATES + BOILERPLATE_TEMPLATES)
+        self._by_code = {code: self._index(templates) for code, templates in CODE_TEMPLATES.items()}
+        self._all_codes = self._index(
+            [template for templates in CODE_TEMPLATES.values() for template in templates]
+        )
+        self._by_field = {field: self._index(templates) for field, templates in FIELD_TEMPLATES.items()}
+
+    def _index(self, templates: List[Tuple[str, Dict[str, str]]]) -> Dict[str, List[LineTemplate]]:
+        """
+        Group templates for this language by the first word of the line
+
+        Templates starting with a slot are grouped under ''.
+        """
+        index: Dict[str, List[LineTemplate]] = {}
+        for pattern, localized in templates:
+            if self.target_lang not in localized:
+                continue
+            template = LineTemplate(pattern, localized)
+            index.setdefault(template.prefix.split(' ', 1)[0], []).append(template)
+        return index
+
+    @property
+    def supported(self) -> bool:
+        """Whether any templates exist for the target language"""
+        return bool(self._common or self._all_codes)
+
+    def _code_index(self, message_code: Optional[str]) -> Dict[str, List[LineTemplate]]:
+        if message_code:
+            for code, index in self._by_code.items():
+                if message_code.startswith(code):
+                    return index
+        return self._all_codes
+
+    def localize_line(self, line: str, message_code: Optional[str] = None,
+                      field: Optional[str] = None) -> Optional[str]:
+        """
+        Localize a single line, or return None if no template matches
+
+        `field` names the alert field the line comes from; its bare value
+        templates are tried before the message line templates.
+        """
+        stripped = line.strip()
+        first_word = stripped.split(' ', 1)[0]
+        indexes = [self._code_index(message_code), self._common]
+        if field in self._by_field:
+            indexes.insert(0, self._by_field[field])
+        for index in indexes:
+            for template in index.get(first_word, []) + index.get('', []):
+                match = template.regex.match(stripped)
+                if match:
+                    return template.render(match, self.target_lang)
+        return None
+
+    def localize(self, text: str, message_code: Optional[str] = None,
+                 fallback: Optional[Callable[[str], str]] = None,
+                 field: Optional[str] = None) -> str:
+        """
+        Localize a message, using `fallback` for unrecognized lines
+
+        All unrecognized lines go to `fallback` as one newline-joined
+        request, so a message costs at most one fallback call and wrapped
+        sentences are translated together. If the result doesn't split
+        back into the same number of lines, it replaces the first
+        unrecognized line and the others are dropped.
+        """
+        lines = text.split('\n')
+        missed = []
+        for i, line in enumerate(lines):
+            if not line.strip():
+                continue
+            localized = self.localize_line(line, message_code, field)
+            if localized is None:
+                self.misses += 1
+                missed.append(i)
+            else:
+                self.hits += 1
+                lines[i] = localized
+
+        if missed and fallback:
+            translated = fallback('\n'.join(lines[i].strip() for i in missed)).split('\n')
+            if len(translated) == len(missed):
+                for i, line in zip(missed, translated):
+                    lines[i] = line
+            else:
+                lines[missed[0]] = '\n'.join(translated)
+                for i in missed[1:]:
+                    lines[i] = None
+        return '\n'.join(line for line in lines if line is not None)
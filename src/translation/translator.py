@@ -1,31 +1,69 @@
 """
 Translation system for space weather alerts
-Supports English and Russian languages
+Supports English and Russian, with fan-out to several target languages
+and offline template localization of known SWPC message lines
 """
 
 from deep_translator import GoogleTranslator
+from concurrent.futures import ThreadPoolExecutor
 import time
 import re
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
+from .templates import TemplateLocalizer
+
+
+# Alert fields sent to the translator
+FIELDS_TO_TRANSLATE = [
+    'warning_type',
+    'warning_condition',
+    'noaa_scale',
+    'potential_impacts',
+    'description',
+    'forecast_data',
+    'full_message'
+]
+
+# Terms to preserve (don't translate)
+PRESERVE_TERMS = {
+    'UTC', 'GMT', 'GPS', 'NASA', 'NOAA', 'API', 'SWPC',
+    'G1', 'G2', 'G3', 'G4', 'G5',
+    'R1', 'R2', 'R3', 'R4', 'R5',
+    'S1', 'S2', 'S3', 'S4', 'S5',
+    'Kp', 'Ap', 'Dst', 'F10.7', 'CME', 'SEP', 'GLE', 'SSC', 'IMF'
+}
+
+
+def preserve_special_terms(text: str, terms) -> Tuple[str, Dict[str, str]]:
+    """Replace special terms with placeholders so they survive translation"""
+    preserved = {}
+    modified_text = text
+    
+    for i, term in enumerate(terms):
+        if term in text:
+            placeholder = f"__PRESERVE_{i}__"
+            preserved[placeholder] = term
+            modified_text = modified_text.replace(term, placeholder)
+    
+    return modified_text, preserved
 
 
 class AlertTranslator:
     """Translator for space weather alerts"""
     
-    def __init__(self, source_lang: str = 'en', target_lang: str = 'ru'):
+    def __init__(self, source_lang: str = 'en', target_lang: str = 'ru', offline: bool = False):
+        self.source_lang = source_lang
+        self.target_lang = target_lang
         self.translator = GoogleTranslator(source=source_lang, target=target_lang)
         self.cache: Dict[str, str] = {}
         self.last_request_time = 0
         self.min_delay = 0.1
         
-        # Terms to preserve (don't translate)
-        self.preserve_terms = {
-            'UTC', 'GMT', 'GPS', 'NASA', 'NOAA', 'API', 'SWPC',
-            'G1', 'G2', 'G3', 'G4', 'G5',
-            'R1', 'R2', 'R3', 'R4', 'R5',
-            'S1', 'S2', 'S3', 'S4', 'S5',
-            'Kp', 'Ap', 'Dst', 'F10.7', 'CME', 'SEP', 'GLE', 'SSC', 'IMF'
-        }
+        # Known SWPC lines are localized from templates; with offline=True
+        # unrecognized text is left as is instead of calling Google Translate
+        self.localizer = TemplateLocalizer(target_lang)
+        self.offline = offline
+        
+        self.preserve_terms = PRESERVE_TERMS
     
     def _rate_limit(self):
         """Rate limiting for API requests"""
@@ -37,16 +75,7 @@ class AlertTranslator:
     
     def _preserve_special_terms(self, text: str) -> tuple:
         """Protect special terms from translation"""
-        preserved = {}
-        modified_text = text
-        
-        for i, term in enumerate(self.preserve_terms):
-            if term in text:
-                placeholder = f"__PRESERVE_{i}__"
-                preserved[placeholder] = term
-                modified_text = modified_text.replace(term, placeholder)
-        
-        return modified_text, preserved
+        return preserve_special_terms(text, self.preserve_terms)
     
     def _restore_special_terms(self, text: str, preserved: Dict[str, str]) -> str:
         """Restore special terms after translation"""
@@ -54,12 +83,15 @@ class AlertTranslator:
             text = text.replace(placeholder, original_term)
         return text
     
-    def translate(self, text: str) -> str:
+    def translate(self, text: str, message_code: Optional[str] = None,
+                  field: Optional[str] = None) -> str:
         """
         Translate text from source to target language
         
         Args:
             text: Source text
+            message_code: SWPC message code, narrows template matching
+            field: Alert field the text comes from, selects field value templates
             
         Returns:
             Translated text
@@ -75,10 +107,69 @@ class AlertTranslator:
         if text in self.cache:
             return self.cache[text]
         
+        # Template localization, machine translation only for unknown lines
+        if self.localizer.supported:
+            translated = self.localizer.localize(text, message_code, fallback=self._machine_translate,
+                                                 field=field)
+            self.cache[text] = translated
+            return translated
+        
+        return self._machine_translate(text)
+    
+    def _machine_translate(self, text: str) -> str:
+        """Translate text with Google Translate"""
+        if not text or self.offline:
+            return text
+        
+        # Protect special terms
+        protected_text, preserved_terms = self._preserve_special_terms(text)
+        return self.translate_protected(text, protected_text, preserved_terms)
+    
+    def translate_prepared(self, segments: List['Segment'], message_code: Optional[str] = None,
+                           field: Optional[str] = None) -> str:
+        """
+        Translate a field prepared by MultiLanguageTranslator
+        
+        Known lines are localized from templates; the remaining lines go to
+        machine translation in one request built from their prepared
+        protection.
+        """
+        text = ''.join(original for original, _, _ in segments)
+        if text in self.cache:
+            return self.cache[text]
+        
+        prepared = {original: (protected, preserved)
+                    for original, protected, preserved in segments if protected is not None}
+        
+        def fallback(missed: str) -> str:
+            if self.offline:
+                return missed
+            protected_lines = []
+            preserved_terms: Dict[str, str] = {}
+            for line in missed.split('\n'):
+                protected, preserved = prepared.get(line, (line, {}))
+                protected_lines.append(protected)
+                preserved_terms.update(preserved)
+            return self.translate_protected(missed, '\n'.join(protected_lines), preserved_terms)
+        
+        if self.localizer.supported:
+            translated = self.localizer.localize(text, message_code, fallback=fallback, field=field)
+        else:
+            translated = fallback('\n'.join(line.strip() for line in text.split('\n')))
+        self.cache[text] = translated
+        return translated
+    
+    def translate_protected(self, text: str, protected_text: str, preserved_terms: Dict[str, str]) -> str:
+        """
+        Translate text whose special terms were already protected
+        
+        Lets callers protect a text once and reuse it for several target
+        languages; `text` is the original and is used as the cache key.
+        """
+        if text in self.cache:
+            return self.cache[text]
+        
         try:
-            # Protect special terms
-            protected_text, preserved_terms = self._preserve_special_terms(text)
-            
             # Rate limiting
             self._rate_limit()
             
@@ -104,19 +195,10 @@ class AlertTranslator:
         
         translated = alert_data.copy()
         
-        fields_to_translate = [
-            'warning_type',
-            'warning_condition',
-            'noaa_scale',
-            'potential_impacts',
-            'description',
-            'forecast_data',
-            'full_message'
-        ]
-        
-        for field in fields_to_translate:
+        message_code = alert_data.get('message_code')
+        for field in FIELDS_TO_TRANSLATE:
             if field in translated and translated[field]:
-                translated[field] = self.translate(translated[field])
+                translated[field] = self.translate(translated[field], message_code, field)
         
         return translated
     
@@ -125,9 +207,89 @@ class AlertTranslator:
         self.cache.clear()
 
 
+# Protected segment: (original, protected, preserved terms); None for separators
+Segment = Tuple[str, Optional[str], Dict[str, str]]
+
+
+class MultiLanguageTranslator:
+    """
+    Translates alerts into several target languages in one pass
+    
+    Each alert field is split into lines and its special terms are
+    protected once; the prepared segments are then translated into every
+    target language in parallel, one worker per language, each with its own
+    translator and cache.
+    """
+    
+    def __init__(self, target_langs: Sequence[str], source_lang: str = 'en'):
+        self.source_lang = source_lang
+        self.target_langs = list(dict.fromkeys(target_langs))
+        self.translators = {lang: get_translator(lang, source_lang) for lang in self.target_langs}
+    
+    def _prepare_text(self, text: str) -> List[Segment]:
+        """Split text into lines and protect special terms"""
+        segments = []
+        for part in re.split(r'(\r?\n)', text.strip()):
+            if not part.strip():
+                segments.append((part, None, {}))
+                continue
+            protected, preserved = preserve_special_terms(part.strip(), PRESERVE_TERMS)
+            segments.append((part.strip(), protected, preserved))
+        return segments
+    
+    def _prepare_alert(self, alert_data: Dict) -> Dict[str, List[Segment]]:
+        """Prepare every translatable field of an alert"""
+        return {
+            field: self._prepare_text(alert_data[field])
+            for field in FIELDS_TO_TRANSLATE
+            if isinstance(alert_data.get(field), str) and alert_data[field].strip()
+        }
+    
+    def _translate_prepared(self, lang: str, alerts: List[Dict],
+                            prepared: List[Dict[str, List[Segment]]]) -> List[Dict]:
+        """Translate prepared alerts into a single language"""
+        translator = self.translators[lang]
+        results = []
+        for alert_data, fields in zip(alerts, prepared):
+            translated = alert_data.copy()
+            message_code = alert_data.get('message_code')
+            for field, segments in fields.items():
+                translated[field] = translator.translate_prepared(segments, message_code, field)
+            results.append(translated)
+        return results
+    
+    def translate_alerts(self, alerts: List[Dict]) -> Dict[str, List[Dict]]:
+        """Translate alert dicts into every target language"""
+        prepared = [self._prepare_alert(alert_data) for alert_data in alerts]
+        if not self.target_langs:
+            return {}
+        
+        with ThreadPoolExecutor(max_workers=len(self.target_langs)) as executor:
+            futures = {
+                lang: executor.submit(self._translate_prepared, lang, alerts, prepared)
+                for lang in self.target_langs
+            }
+            return {lang: future.result() for lang, future in futures.items()}
+    
+    def translate_alert(self, alert_data: Dict) -> Dict[str, Dict]:
+        """Translate a single alert dict into every target language"""
+        return {lang: alerts[0] for lang, alerts in self.translate_alerts([alert_data]).items()}
+
+
 # Global translator instance
 translator = AlertTranslator()
 
+# Translators per target language, so each language keeps its own cache
+_translators: Dict[Tuple[str, str], AlertTranslator] = {('en', 'ru'): translator}
+
+
+def get_translator(target_lang: str, source_lang: str = 'en') -> AlertTranslator:
+    """Get the shared translator for a language pair"""
+    key = (source_lang, target_lang)
+    if key not in _translators:
+        _translators[key] = AlertTranslator(source_lang, target_lang)
+    return _translators[key]
+
 
 def translate_text(text: str) -> str:
     """Quick function to translate text"""
@@ -138,3 +300,8 @@ def translate_alert_data(alert_data: Dict) -> Dict:
     """Quick function to translate alert data"""
     return translator.translate_alert(alert_data)
 
+
+def translate_alerts_multi(alerts: List[Dict], target_langs: Sequence[str]) -> Dict[str, List[Dict]]:
+    """Quick function to translate alert dicts into several languages"""
+    return MultiLanguageTranslator(target_langs).translate_alerts(alerts)
+
@@ -6,7 +6,7 @@ High-quality graphics for academic presentations
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import plotly.graph_objects as go
 import plotly.express as px
 from pathlib import Path
@@ -180,11 +180,20 @@ def create_earth_visualization():
     return output_path
 
 
-def create_interactive_plotly_chart():
-    """Create interactive Plotly visualization"""
-    dates = [datetime.now() - timedelta(hours=i) for i in range(72, 0, -1)]
-    wind_speed = 300 + np.random.randn(72) * 50
-    kp_index = 2 + np.random.randn(72) * 1.5
+def build_space_weather_figure(end=None, seed=0):
+    """
+    Build the interactive solar wind / Kp index figure
+
+    The sample data is seeded and ends at the start of the current UTC hour
+    (or at `end`), so builds within the same hour give the same figure and
+    the dashboard only rewrites its chart data once an hour.
+    """
+    if end is None:
+        end = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0, tzinfo=None)
+    rng = np.random.default_rng([seed, int(end.replace(tzinfo=timezone.utc).timestamp())])
+    dates = [end - timedelta(hours=i) for i in range(72, 0, -1)]
+    wind_speed = 300 + rng.standard_normal(72) * 50
+    kp_index = 2 + rng.standard_normal(72) * 1.5
     
     fig = go.Figure()
     
@@ -221,14 +230,43 @@ def create_interactive_plotly_chart():
         hovermode='x unified'
     )
     
-    # Save
+    return fig
+
+
+def create_interactive_plotly_chart(fig=None):
+    """Create interactive Plotly visualization"""
+    if fig is None:
+        fig = build_space_weather_figure()
+    
+    # Save (plotly.js goes to a shared plotly.min.js next to the page
+    # instead of being embedded in every HTML file)
     output_path = Path(__file__).parent.parent.parent / 'visualizations' / 'interactive_chart.html'
-    fig.write_html(str(output_path))
+    fig.write_html(str(output_path), include_plotlyjs='directory')
     print(f"Saved: {output_path}")
     
     return output_path
 
 
+def create_dashboard(fig=None):
+    """Build the static dashboard with shared assets and versioned chart data"""
+    try:
+        from .dashboard_build import build_dashboard, DEFAULT_DASHBOARD_DIR
+    except ImportError:
+        # Running as a script
+        from dashboard_build import build_dashboard, DEFAULT_DASHBOARD_DIR
+    
+    if fig is None:
+        fig = build_space_weather_figure()
+    
+    stats = build_dashboard(
+        {'space_weather': fig},
+        updated=datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M UTC')
+    )
+    print(f"Dashboard: {len(stats['written'])} files written, {len(stats['unchanged'])} unchanged")
+    
+    return DEFAULT_DASHBOARD_DIR / 'index.html'
+
+
 def main():
     """Generate all visualizations"""
     print("=" * 60)
@@ -249,8 +287,14 @@ def main():
     print("\n4. Creating Earth visualization...")
     visualizations.append(create_earth_visualization())
     
+    # One figure for both pages, so they show the same data
+    space_weather = build_space_weather_figure()
+    
     print("\n5. Creating interactive Plotly chart...")
-    visualizations.append(create_interactive_plotly_chart())
+    visualizations.append(create_interactive_plotly_chart(space_weather))
+    
+    print("\n6. Building dashboard...")
+    visualizations.append(create_dashboard(space_weather))
     
     print("\n" + "=" * 60)
     print("All visualizations created successfully!")
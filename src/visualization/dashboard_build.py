@@ -0,0 +1,211 @@
+"""
+Static dashboard build for SolarWind Dashboard
+plotly.js and page assets are written once; chart data goes to small
+content-hashed JSON files, so a refresh only rewrites what changed
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Dict, Optional, Set
+
+import plotly
+import plotly.io as pio
+from plotly.offline import get_plotlyjs
+
+
+DEFAULT_DASHBOARD_DIR = Path(__file__).parent.parent.parent / 'dashboard'
+
+# How often the page checks the manifest for new chart data (ms)
+REFRESH_INTERVAL_MS = 60000
+
+DASHBOARD_CSS = """\
+body{margin:0;font-family:Inter,ui-sans-serif,system-ui,-apple-system,"Segoe UI",Roboto,Arial;\
+color:#d8eaf2;background:linear-gradient(180deg,#02030a 0%,#071225 60%)}
+.container{max-width:1100px;margin:36px auto;padding:20px}
+h1{margin:0 0 18px 0;font-size:1.4rem;color:#00d1ff}
+.chart{background:#0e1724;border-radius:12px;padding:12px;margin-bottom:18px;min-height:500px}
+small{color:#9fb3c8}
+"""
+
+DASHBOARD_JS = """\
+(function () {
+  var loaded = {};
+
+  function loadChart(name, chart) {
+    if (loaded[name] === chart.file) return Promise.resolve();
+    var div = document.getElementById('chart-' + name);
+    if (!div) {
+      div = document.createElement('div');
+      div.id = 'chart-' + name;
+      div.className = 'chart';
+      document.getElementById('charts').appendChild(div);
+    }
+    return fetch(chart.file).then(function (r) { return r.json(); }).then(function (fig) {
+      loaded[name] = chart.file;
+      return Plotly.react(div, fig.data, fig.layout, {responsive: true});
+    });
+  }
+
+  function refresh() {
+    fetch('manifest.json', {cache: 'no-cache'})
+      .then(function (r) { return r.json(); })
+      .then(function (manifest) {
+        document.getElementById('updated').textContent = manifest.updated || '';
+        return Promise.all(Object.keys(manifest.charts).map(function (name) {
+          return loadChart(name, manifest.charts[name]);
+        }));
+      })
+      .catch(function (e) { console.error('Dashboard refresh failed', e); });
+  }
+
+  refresh();
+  setInterval(refresh, %(interval)d);
+})();
+"""
+
+INDEX_TEMPLATE = """\
+<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="utf-8" />
+  <meta name="viewport" content="width=device-width,initial-scale=1" />
+  <title>SolarWind Dashboard — Live</title>
+  <link rel="stylesheet" href="%(css)s" />
+</head>
+<body>
+  <div class="container">
+    <h1>Real-time Space Weather Monitoring</h1>
+    <div id="charts"></div>
+    <small>Updated: <span id="updated"></span></small>
+  </div>
+  <script src="%(plotly)s"></script>
+  <script src="%(js)s"></script>
+</body>
+</html>
+"""
+
+
+def _content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()[:12]
+
+
+def _write_if_changed(path: Path, data: bytes) -> bool:
+    """Write a file unless it already has exactly this content"""
+    if path.exists() and path.stat().st_size == len(data) and path.read_bytes() == data:
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
+    tmp_path.write_bytes(data)
+    tmp_path.replace(path)
+    return True
+
+
+def _write_hashed(directory: Path, stem: str, suffix: str, data: bytes, stats: Dict) -> str:
+    """
+    Write content under a content-hashed name
+
+    Returns the file name relative to `directory`. Older versions are
+    left for _prune.
+    """
+    name = f"{stem}.{_content_hash(data)}{suffix}"
+    path = directory / name
+    if path.exists():
+        stats['unchanged'].append(name)
+    else:
+        _write_if_changed(path, data)
+        stats['written'].append(name)
+    return name
+
+
+def _manifest_files(manifest: Dict) -> Set[str]:
+    """Files a manifest refers to, relative to the dashboard directory"""
+    files = set(manifest.get('assets', {}).values())
+    files.update(chart['file'] for chart in manifest.get('charts', {}).values())
+    return files
+
+
+def _read_manifest(path: Path) -> Dict:
+    try:
+        return json.loads(path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+
+
+def _prune(output_dir: Path, keep: Set[str], stats: Dict):
+    """
+    Remove asset and chart data files that are not in `keep`
+
+    Covers charts that were dropped from the dashboard as well as older
+    versions of the ones still on it.
+    """
+    for directory in ('assets', 'data'):
+        for path in (output_dir / directory).glob('*'):
+            relative = f"{directory}/{path.name}"
+            if path.is_file() and relative not in keep:
+                path.unlink()
+                stats['removed'].append(relative)
+
+
+def build_assets(output_dir: Path = DEFAULT_DASHBOARD_DIR, stats: Optional[Dict] = None) -> Dict[str, str]:
+    """Write shared assets once; returns their paths relative to output_dir"""
+    stats = stats if stats is not None else {'written': [], 'unchanged': [], 'removed': []}
+    assets_dir = Path(output_dir) / 'assets'
+    assets_dir.mkdir(parents=True, exist_ok=True)
+
+    # plotly.js is versioned by the plotly release, so the multi-megabyte
+    # bundle is only read and written when plotly is upgraded
+    plotly_name = f"plotly-{plotly.__version__}.min.js"
+    plotly_path = assets_dir / plotly_name
+    if plotly_path.exists():
+        stats['unchanged'].append(plotly_name)
+    else:
+        _write_if_changed(plotly_path, get_plotlyjs().encode('utf-8'))
+        stats['written'].append(plotly_name)
+
+    js = (DASHBOARD_JS % {'interval': REFRESH_INTERVAL_MS}).encode('utf-8')
+    return {
+        'plotly': f"assets/{plotly_name}",
+        'css': f"assets/{_write_hashed(assets_dir, 'dashboard', '.css', DASHBOARD_CSS.encode('utf-8'), stats)}",
+        'js': f"assets/{_write_hashed(assets_dir, 'dashboard', '.js', js, stats)}",
+    }
+
+
+def build_dashboard(charts: Dict, output_dir: Path = DEFAULT_DASHBOARD_DIR, updated: str = '') -> Dict:
+    """
+    Build the static dashboard
+
+    Files from the previous build stay until the next one, so a page that
+    fetched the old manifest just before it was replaced can still load
+    everything it refers to; anything older is removed.
+
+    Args:
+        charts: chart name -> plotly Figure, in display order
+        output_dir: Output directory
+        updated: Timestamp text shown on the page
+
+    Returns:
+        {'written': [...], 'unchanged': [...], 'removed': [...]} file names
+    """
+    output_dir = Path(output_dir)
+    stats = {'written': [], 'unchanged': [], 'removed': []}
+    previous = _read_manifest(output_dir / 'manifest.json')
+    assets = build_assets(output_dir, stats)
+
+    data_dir = output_dir / 'data'
+    data_dir.mkdir(parents=True, exist_ok=True)
+    manifest = {'updated': updated, 'assets': assets, 'charts': {}}
+    for name, fig in charts.items():
+        data = pio.to_json(fig, validate=False, pretty=False).encode('utf-8')
+        file_name = _write_hashed(data_dir, name, '.json', data, stats)
+        manifest['charts'][name] = {'file': f"data/{file_name}"}
+
+    for path, data in [
+        (output_dir / 'manifest.json', json.dumps(manifest, indent=2).encode('utf-8')),
+        (output_dir / 'index.html', (INDEX_TEMPLATE % assets).encode('utf-8')),
+    ]:
+        changed = _write_if_changed(path, data)
+        stats['written' if changed else 'unchanged'].append(path.name)
+
+    _prune(output_dir, _manifest_files(manifest) | _manifest_files(previous), stats)
+    return stats
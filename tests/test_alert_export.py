@@ -0,0 +1,71 @@
+"""
+Alert export round trips through NDJSON, Parquet and Arrow
+"""
+
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from src.alerts.alert_models import Alert, GeomagneticAlert
+from src.alerts.alert_processor import AlertProcessor
+from src.export import ALERT_SCHEMA, read_alerts, write_arrow, write_ndjson, write_parquet
+
+
+WRITERS = {
+    'ndjson': write_ndjson,
+    'parquet': write_parquet,
+    'arrow': write_arrow,
+}
+
+
+def _alerts():
+    alerts = [
+        GeomagneticAlert(
+            message_code='ALTK06',
+            serial_number=str(1000 + i),
+            issue_time=datetime(2024, 5, 10, 17, 34, i),
+            warning_type="Geomagnetic K-index of 6",
+            full_message=f"Serial Number: {1000 + i}",
+            valid_from=datetime(2024, 5, 10, 18, 0),
+            valid_to=datetime(2024, 5, 10, 21, 0, 0, 500) if i % 2 else datetime(2024, 5, 10, 21, 0),
+            noaa_scale="G2 - Moderate",
+        )
+        for i in range(5)
+    ]
+    alerts.append(Alert('ALTXMF', '0042', datetime(2024, 5, 11, 1, 2), "X-Ray Flux exceeded M5", "X-ray"))
+    return alerts
+
+
+@pytest.mark.parametrize('records', ['alerts', 'dicts'])
+def test_formats_return_identical_frames(tmp_path, records):
+    alerts = _alerts()
+    if records == 'dicts':
+        alerts = AlertProcessor().process_alerts(alerts, translate=False)
+
+    frames = {}
+    for name, writer in WRITERS.items():
+        path = tmp_path / f"alerts.{name}"
+        assert writer(alerts, path, chunk_size=2) == len(alerts)
+        frames[name] = read_alerts(path)
+
+    expected = frames['arrow']
+    assert list(expected.columns) == [name for name, _ in ALERT_SCHEMA]
+    assert str(expected['warning_condition'].dtype) == 'string'
+    assert str(expected['begin_time'].dtype) == 'datetime64[us]'
+    assert expected['valid_from'].notna().sum() == 5
+    for name in ('ndjson', 'parquet'):
+        pd.testing.assert_frame_equal(frames[name], expected)
+
+
+def test_empty_exports_have_the_schema(tmp_path):
+    frames = {}
+    for name, writer in WRITERS.items():
+        path = tmp_path / f"empty.{name}"
+        assert writer([], path) == 0
+        frames[name] = read_alerts(path)
+
+    for name in ('ndjson', 'parquet'):
+        pd.testing.assert_frame_equal(frames[name], frames['arrow'])
+    assert len(frames['ndjson']) == 0
+    assert list(frames['ndjson'].columns) == [name for name, _ in ALERT_SCHEMA]
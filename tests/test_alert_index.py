@@ -0,0 +1,92 @@
+"""
+Active-alert interval index and extension/cancellation chains
+"""
+
+import random
+from datetime import datetime, timedelta
+
+from src.alerts.alert_index import ActiveAlertIndex, OPEN_END
+from src.alerts.alert_models import GeomagneticAlert
+from src.alerts.alert_processor import AlertProcessor
+
+
+BASE = datetime(2024, 5, 10)
+
+
+def _hours(hours):
+    return BASE + timedelta(hours=hours) if hours is not None else None
+
+
+def _alert(serial, issue_hour, valid_from=None, valid_to=None, extends=None, cancels=None):
+    return GeomagneticAlert(
+        message_code='WARK',
+        serial_number=serial,
+        issue_time=_hours(issue_hour),
+        warning_type="Geomagnetic K-index of 5 expected",
+        full_message="",
+        valid_from=_hours(valid_from),
+        valid_to=_hours(valid_to),
+        extends_serial=extends,
+        cancels_serial=cancels,
+    )
+
+
+def _random_alerts(count, seed):
+    rng = random.Random(seed)
+    alerts = []
+    for serial in range(count):
+        start = rng.uniform(0, 500)
+        end = None if rng.random() < 0.05 else start + rng.uniform(0, 24)
+        alerts.append(_alert(str(1000 + serial), start, start, end))
+    return alerts
+
+
+def _brute_force(alerts, start, end):
+    return {
+        alert.serial_number for alert in alerts
+        if alert.starts_at <= end and (alert.valid_to or OPEN_END) >= start
+    }
+
+
+def test_point_and_range_queries_match_brute_force():
+    alerts = _random_alerts(300, seed=7)
+    index = ActiveAlertIndex(alerts)
+    rng = random.Random(11)
+
+    for _ in range(200):
+        at = BASE + timedelta(hours=rng.uniform(-10, 530))
+        assert {a.serial_number for a in index.active_at(at)} == _brute_force(alerts, at, at)
+
+        start = BASE + timedelta(hours=rng.uniform(-10, 530))
+        end = start + timedelta(hours=rng.uniform(0, 48))
+        assert {a.serial_number for a in index.active_during(start, end)} == _brute_force(alerts, start, end)
+
+
+def test_extension_then_cancellation():
+    original = _alert('1001', 0, 0, 3)
+    extension = _alert('1002', 2, 2, 9, extends='1001')
+    cancel = _alert('1003', 6, cancels='1002')
+
+    index = ActiveAlertIndex([original, extension])
+    assert index.active_at(BASE + timedelta(hours=5)) == [extension]
+    assert original.is_active(BASE + timedelta(hours=5))
+
+    index = ActiveAlertIndex([original, extension, cancel])
+    assert index.active_at(BASE + timedelta(hours=5)) == [extension]
+    assert index.active_at(BASE + timedelta(hours=7)) == []
+    assert not original.is_active(BASE + timedelta(hours=7))
+    assert not extension.is_active(BASE + timedelta(hours=7))
+    assert not cancel.is_active(BASE + timedelta(hours=7))
+
+
+def test_processor_rebuilds_index_when_an_alert_is_replaced():
+    processor = AlertProcessor()
+    alerts = [_alert('1001', 0, 0, 3), _alert('1002', 10, 10, 13)]
+    at = BASE + timedelta(hours=1)
+
+    assert processor.get_active_alerts(alerts, at) == [alerts[0]]
+    index = processor.get_active_index(alerts)
+    assert processor.get_active_index(alerts) is index
+
+    alerts[0] = _alert('1003', 20, 20, 23)
+    assert processor.get_active_alerts(alerts, at) == []
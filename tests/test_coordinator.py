@@ -0,0 +1,112 @@
+"""
+Leader lease and shared cache across coordinators
+"""
+
+import sqlite3
+
+import pytest
+
+from src.coordination import coordinator as coordinator_module
+from src.coordination.coordinator import FetchCoordinator
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_700_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeFetcher:
+    is_stale = False
+    last_error = None
+
+    def __init__(self, fetches):
+        self.fetches = fetches
+
+    def get_alerts(self):
+        self.fetches.append(1)
+        return [f"alert {len(self.fetches)}"]
+
+
+class FakeProcessor:
+    def process_alerts(self, alerts, translate=True):
+        return [{'warning_type': alert} for alert in alerts]
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(coordinator_module.time, 'time', clock)
+    return clock
+
+
+def _coordinator(tmp_path, fetches):
+    coordinator = FetchCoordinator(tmp_path / 'coordination.db', poll_interval=60.0, lease_ttl=180.0,
+                                   fetcher=FakeFetcher(fetches))
+    coordinator._processor = FakeProcessor()
+    return coordinator
+
+
+def test_single_fetch_per_interval_and_takeover_after_ttl(tmp_path, clock):
+    fetches = []
+    leader = _coordinator(tmp_path, fetches)
+    follower = _coordinator(tmp_path, fetches)
+
+    first = leader.poll()
+    assert follower.poll() == first
+    assert leader.poll() == first
+    assert len(fetches) == 1
+    assert leader.is_leader and not follower.is_leader
+
+    # Stale data, but the leader still holds the lease
+    clock.now += 90
+    assert follower.poll() == first
+    assert len(fetches) == 1
+
+    # The leader stopped renewing; the follower takes over after the TTL
+    clock.now += 100
+    taken_over = follower.poll()
+    assert len(fetches) == 2
+    assert taken_over['alerts'] == [{'warning_type': 'alert 2'}]
+    assert follower.is_leader
+    assert leader.poll() == taken_over
+
+
+def test_release_hands_over_immediately(tmp_path, clock):
+    fetches = []
+    leader = _coordinator(tmp_path, fetches)
+    follower = _coordinator(tmp_path, fetches)
+
+    leader.poll()
+    leader.close()
+    clock.now += 61
+    follower.poll()
+    assert follower.is_leader
+    assert len(fetches) == 2
+
+
+def test_refresh_error_keeps_last_payload(tmp_path, clock):
+    fetches = []
+    coordinator = _coordinator(tmp_path, fetches)
+    first = coordinator.poll()
+
+    def broken():
+        raise RuntimeError("parser crashed")
+
+    coordinator._fetcher.get_alerts = broken
+    clock.now += 61
+    assert coordinator.poll() == first
+
+
+def test_publish_error_returns_fresh_payload(tmp_path, clock, monkeypatch):
+    fetches = []
+    coordinator = _coordinator(tmp_path, fetches)
+
+    def locked(key, value):
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(coordinator.cache, 'publish', locked)
+    payload = coordinator.poll()
+    assert payload['alerts'] == [{'warning_type': 'alert 1'}]
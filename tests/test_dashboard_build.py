@@ -0,0 +1,29 @@
+"""
+Stable dashboard builds from the space weather figure
+"""
+
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip('matplotlib')
+pytest.importorskip('plotly')
+
+from src.visualization.create_visualizations import build_space_weather_figure
+from src.visualization.dashboard_build import build_dashboard
+
+
+END = datetime(2024, 5, 10, 18)
+
+
+def test_figure_is_reproducible():
+    assert build_space_weather_figure(END).to_json() == build_space_weather_figure(END).to_json()
+    assert build_space_weather_figure(END).to_json() != build_space_weather_figure(END, seed=1).to_json()
+
+
+def test_rebuild_with_same_data_writes_nothing(tmp_path):
+    build_dashboard({'space_weather': build_space_weather_figure(END)}, tmp_path, updated='a')
+    stats = build_dashboard({'space_weather': build_space_weather_figure(END)}, tmp_path, updated='a')
+
+    assert stats['written'] == []
+    assert stats['removed'] == []
@@ -0,0 +1,110 @@
+"""
+Deduplicated, compressed message body store
+"""
+
+import struct
+
+import pytest
+
+from src.alerts.message_store import MessageStore
+
+
+def _bulletin(serial, k=5):
+    return (
+        f"Space Weather Message Code: ALTK0{k}\r\n"
+        f"Serial Number: {serial}\r\n"
+        f"Issue Time: 2024 May 10 {serial % 24:02d}00 UTC\r\n"
+        "\r\n"
+        f"ALERT: Geomagnetic K-index of {k}\r\n"
+        "Active Warning: Yes\r\n"
+        "NOAA Scale: G1 - Minor\r\n"
+        "\r\n"
+        "Potential Impacts: Area of impact primarily poleward of 60 degrees Geomagnetic Latitude.\r\n"
+        "Induced Currents - Weak power grid fluctuations can occur.\r\n"
+        "Aurora - Aurora may be visible at high latitudes such as Canada and Alaska."
+    )
+
+
+def test_add_get_round_trip():
+    store = MessageStore()
+    bodies = [_bulletin(serial) for serial in range(1000, 1050)] + ["", "single line", "ünïcode\n"]
+
+    ids = [store.add(body) for body in bodies]
+
+    assert [store.get(body_id) for body_id in ids] == bodies
+    with pytest.raises(IndexError):
+        store.get(len(store))
+
+
+def test_identical_bodies_share_an_id_and_lines_are_stored_once():
+    store = MessageStore()
+    first = store.add(_bulletin(1001))
+    stored = store.stored_bytes
+
+    assert store.add(_bulletin(1001)) == first
+    assert store.stored_bytes == stored
+    assert len(store) == 1
+
+    # A second bulletin only adds its distinct lines plus its line ids
+    store.add(_bulletin(1002))
+    line_ids = 4 * len(_bulletin(1002).splitlines())
+    assert store.stored_bytes - stored < line_ids + len("Serial Number: 1002\r\nIssue Time: 2024 May 10 1800 UTC\r\n")
+
+
+def test_raw_bytes_counts_every_add():
+    store = MessageStore()
+    body = _bulletin(1001)
+    for _ in range(3):
+        store.add(body)
+
+    assert store.raw_bytes == 3 * len(body.encode('utf-8'))
+
+
+def test_memory_follows_stored_size():
+    store = MessageStore()
+    bodies = [_bulletin(serial, 5 + serial % 5) for serial in range(5000)]
+    for body in bodies:
+        store.add(body)
+
+    raw = sum(len(body.encode('utf-8')) for body in bodies)
+    assert store.stored_bytes < raw / 4
+    assert store.memory_bytes < raw / 2
+
+
+def test_save_load_round_trip(tmp_path):
+    store = MessageStore.train([_bulletin(serial) for serial in range(10)])
+    bodies = [_bulletin(serial, 5 + serial % 5) for serial in range(2000)]
+    ids = [store.add(body) for body in bodies]
+    path = tmp_path / 'messages.swms'
+
+    store.save(path)
+    loaded = MessageStore.load(path)
+
+    assert loaded.dictionary == store.dictionary
+    assert loaded.raw_bytes == store.raw_bytes
+    assert loaded.stored_bytes == store.stored_bytes
+    assert [loaded.get(body_id) for body_id in ids] == bodies
+
+    # Dedup state survives the round trip
+    stored = loaded.stored_bytes
+    assert loaded.add(bodies[123]) == ids[123]
+    assert loaded.stored_bytes == stored
+
+
+def test_saved_integers_are_little_endian(tmp_path):
+    store = MessageStore(dictionary=b'')
+    store.add("a\nb\na\n")
+    path = tmp_path / 'messages.swms'
+    store.save(path)
+
+    data = path.read_bytes()
+    # Single body at the end of the file: count, then its line ids
+    assert struct.unpack('<4I', data[-16:]) == (3, 0, 1, 0)
+
+
+def test_load_rejects_other_files(tmp_path):
+    path = tmp_path / 'not_a_store.bin'
+    path.write_bytes(b'PK\x03\x04')
+
+    with pytest.raises(ValueError):
+        MessageStore.load(path)
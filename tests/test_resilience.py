@@ -0,0 +1,135 @@
+"""
+Circuit breaker states and last-known-good snapshot fallback
+"""
+
+import requests
+
+from src.data_ingestion import resilience
+from src.data_ingestion.noaa_api import NOAADataFetcher
+from src.data_ingestion.resilience import CircuitBreaker, CircuitState
+
+
+K_ALERT = """KA 1001
+Issue Time: 2024 May 10 1734 UTC
+ALERT: Geomagnetic K-index of 5
+Valid From: 2024 May 10 1734 UTC
+Valid To: 2024 May 10 2100 UTC
+NOAA Scale: G1 - Minor
+"""
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeResponse:
+    def __init__(self, text, status_code=200):
+        self.text = text
+        self.status_code = status_code
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Server Error")
+
+
+class FakeSession:
+    """Replays queued responses or exceptions"""
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.requests = 0
+
+    def get(self, url, timeout=None):
+        self.requests += 1
+        result = self.results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+def _fetcher(tmp_path, *results, **breaker_args):
+    fetcher = NOAADataFetcher(base_url='http://noaa.test',
+                              snapshot_path=tmp_path / 'wwv_snapshot.txt',
+                              breaker=CircuitBreaker(**breaker_args))
+    fetcher.session = FakeSession(*results)
+    return fetcher
+
+
+def test_breaker_opens_after_threshold_and_probes_after_timeout(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(resilience.time, 'monotonic', clock)
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60.0)
+
+    breaker.record_failure()
+    assert breaker.state == CircuitState.CLOSED
+    breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+    assert not breaker.allow_request()
+
+    clock.now += 60.0
+    assert breaker.state == CircuitState.HALF_OPEN
+    assert breaker.allow_request()
+    # Only one probe at a time
+    assert not breaker.allow_request()
+
+    breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+
+    clock.now += 60.0
+    assert breaker.allow_request()
+    breaker.record_success()
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.failure_count == 0
+
+
+def test_failure_serves_last_known_good_snapshot(tmp_path):
+    fetcher = _fetcher(tmp_path, FakeResponse(K_ALERT), requests.ConnectionError("connection refused"))
+
+    assert len(fetcher.get_alerts()) == 1
+    assert not fetcher.is_stale
+
+    alerts = fetcher.get_alerts()
+    assert len(alerts) == 1
+    assert alerts[0].is_stale
+    assert fetcher.is_stale
+    assert fetcher.last_error == "connection refused"
+
+
+def test_open_circuit_keeps_upstream_error(tmp_path):
+    fetcher = _fetcher(tmp_path, FakeResponse(K_ALERT), FakeResponse('', 503),
+                       failure_threshold=1, reset_timeout=3600.0)
+
+    fetcher.get_alerts()
+    fetcher.get_alerts()
+    assert fetcher.breaker.state == CircuitState.OPEN
+
+    # Served from the snapshot without touching the network
+    alerts = fetcher.get_alerts()
+    assert fetcher.session.requests == 2
+    assert len(alerts) == 1 and alerts[0].is_stale
+    assert fetcher.last_error == "503 Server Error"
+
+
+def test_unparseable_body_does_not_replace_snapshot(tmp_path):
+    fetcher = _fetcher(tmp_path, FakeResponse(K_ALERT), FakeResponse('<html>Service Unavailable</html>'),
+                       FakeResponse(''), requests.Timeout("timed out"))
+
+    fetcher.get_alerts()
+    assert fetcher.get_alerts() == []
+    assert fetcher.get_alerts() == []
+
+    alerts = fetcher.get_alerts()
+    assert [alert.serial_number for alert in alerts] == ['1001']
+    assert fetcher.is_stale
+
+
+def test_no_snapshot_returns_nothing(tmp_path):
+    fetcher = _fetcher(tmp_path, requests.ConnectionError("connection refused"))
+
+    assert fetcher.get_alerts() == []
+    assert not fetcher.is_stale
+    assert fetcher.last_error == "connection refused"
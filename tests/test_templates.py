@@ -0,0 +1,149 @@
+"""
+Template localization of standard SWPC alerts
+"""
+
+import pytest
+
+from src.data_ingestion.noaa_api import NOAADataFetcher
+from src.alerts.alert_processor import AlertProcessor
+from src.translation import translator as translator_module
+from src.translation.translator import AlertTranslator, MultiLanguageTranslator
+
+
+# A complete ALTK06 bulletin as published by SWPC
+ALTK06 = """Space Weather Message Code: ALTK06
+Serial Number: 1234
+Issue Time: 2024 May 10 1734 UTC
+
+ALERT: Geomagnetic K-index of 6
+Threshold Reached: 2024 May 10 1730 UTC
+Synoptic Period: 1500-1800 UTC
+
+Active Warning: Yes
+NOAA Scale: G2 - Moderate
+
+NOAA Space Weather Scale descriptions can be found at
+www.swpc.noaa.gov/noaa-scales-explanation
+
+Potential Impacts: Area of impact primarily poleward of 55 degrees Geomagnetic Latitude.
+Induced Currents - Power grid fluctuations can occur. High-latitude power systems may experience voltage alarms.
+Spacecraft - Satellite orientation irregularities may occur; increased drag on low Earth-orbit satellites is possible.
+Radio - HF (high frequency) radio propagation can fade at higher latitudes.
+Aurora - Aurora may be seen as low as New York to Wisconsin to Washington state."""
+
+# The same bulletin in the single-block layout the wwv.txt parser reads
+K_ALERT = """KA 1234
+Issue Time: 2024 May 10 1734 UTC
+ALERT: Geomagnetic K-index of 6
+Threshold Reached: 2024 May 10 1730 UTC
+Synoptic Period: 1500-1800 UTC
+Active Warning: Yes
+NOAA Scale: G2 - Moderate
+NOAA Space Weather Scale descriptions can be found at
+www.swpc.noaa.gov/noaa-scales-explanation
+Potential Impacts: Area of impact primarily poleward of 55 degrees Geomagnetic Latitude.
+Induced Currents - Power grid fluctuations can occur. High-latitude power systems may experience voltage alarms.
+Spacecraft - Satellite orientation irregularities may occur; increased drag on low Earth-orbit satellites is possible.
+Radio - HF (high frequency) radio propagation can fade at higher latitudes.
+Aurora - Aurora may be seen as low as New York to Wisconsin to Washington state."""
+
+
+class StubGoogleTranslator:
+    """Stands in for deep_translator.GoogleTranslator and records requests"""
+
+    calls = []
+
+    def __init__(self, source='en', target='ru'):
+        self.target = target
+
+    def translate(self, text):
+        StubGoogleTranslator.calls.append(text)
+        return '\n'.join(f"<{line}>" for line in text.split('\n'))
+
+
+@pytest.fixture
+def google(monkeypatch):
+    StubGoogleTranslator.calls = []
+    monkeypatch.setattr(translator_module, 'GoogleTranslator', StubGoogleTranslator)
+    # Fresh per-language translators for MultiLanguageTranslator
+    monkeypatch.setattr(translator_module, '_translators', {})
+    return StubGoogleTranslator.calls
+
+
+def _bulletin_dict():
+    return {
+        'message_code': 'ALTK06',
+        'serial_number': '1234',
+        'warning_type': "Geomagnetic K-index of 6",
+        'noaa_scale': "G2 - Moderate",
+        'potential_impacts': "Area of impact primarily poleward of 55 degrees Geomagnetic Latitude.",
+        'full_message': ALTK06,
+    }
+
+
+def _parsed_alert_dict():
+    alerts = NOAADataFetcher().parse_alerts(K_ALERT)
+    assert len(alerts) == 1
+    return AlertProcessor().process_alerts(alerts, translate=False)[0]
+
+
+def test_swpc_bulletin_needs_no_machine_translation(google):
+    translated = AlertTranslator(target_lang='ru').translate_alert(_bulletin_dict())
+
+    assert google == []
+    assert translated['warning_type'] == "Геомагнитный K-индекс 6"
+    assert translated['noaa_scale'] == "G2 - Умеренная"
+    assert "Радиосвязь - В высоких широтах возможны замирания КВ-радиосвязи." in translated['full_message']
+    # Blank lines between sections are kept
+    assert translated['full_message'].count('\n\n') == ALTK06.count('\n\n')
+
+
+def test_parsed_k_alert_needs_no_machine_translation(google):
+    translated = AlertTranslator(target_lang='ru').translate_alert(_parsed_alert_dict())
+
+    assert google == []
+    assert translated['warning_type'] == "Геомагнитный K-индекс 6"
+    assert translated['full_message'].startswith("KA 1234\nВремя выпуска: 10.05.2024 17:34 UTC")
+
+
+def test_multi_language_bulletin_needs_no_machine_translation(google):
+    translated = MultiLanguageTranslator(['ru']).translate_alerts([_bulletin_dict(), _parsed_alert_dict()])
+
+    assert google == []
+    assert [alert['warning_type'] for alert in translated['ru']] == ["Геомагнитный K-индекс 6"] * 2
+
+
+def test_unknown_lines_go_out_in_one_request(google):
+    text = "Comment: A CME arrived early.\nKp 6 reached at 1730 UTC.\nSerial Number: 1234"
+
+    translated = AlertTranslator(target_lang='ru').translate(text, 'ALTK06', 'full_message')
+
+    # Both unknown lines in one request, special terms protected
+    assert len(google) == 1
+    assert google[0].count('\n') == 1
+    assert 'UTC' not in google[0] and 'Kp' not in google[0]
+    assert translated.split('\n') == [
+        "<Comment: A CME arrived early.>",
+        "<Kp 6 reached at 1730 UTC.>",
+        "Серийный номер: 1234",
+    ]
+
+
+def test_multi_language_unknown_lines_go_out_in_one_request(google):
+    alert = _bulletin_dict()
+    alert['full_message'] += "\nComment: A CME arrived early.\nKp 6 reached at 1730 UTC."
+
+    translated = MultiLanguageTranslator(['ru']).translate_alerts([alert])['ru'][0]
+
+    assert len(google) == 1
+    assert translated['full_message'].endswith("<Comment: A CME arrived early.>\n<Kp 6 reached at 1730 UTC.>")
+
+
+def test_k_alert_fields_offline():
+    alert = NOAADataFetcher().parse_alerts(K_ALERT)[0]
+    translator = AlertTranslator(target_lang='ru', offline=True)
+
+    assert translator.translate(alert.warning_type, field='warning_type') == "Геомагнитный K-индекс 6"
+    assert translator.translate(alert.noaa_scale, field='noaa_scale') == "G2 - Умеренная"
+    assert translator.translate('Onset', field='warning_condition') == "Начало"
+    assert translator.translate(alert.potential_impacts, field='potential_impacts').startswith("Зона воздействия")